@@ -12,6 +12,9 @@ This file controls:
 For detailed documentation with examples, see:
     docs/AUTOTUNE_GUIDE.md
 
+This file is read as data, not run as code: keep every setting a plain value
+(numbers, strings, True/False, lists and dicts - no math or imports).
+
 ================================================================================
                        OVERRIDE PRIORITY SYSTEM
 ================================================================================
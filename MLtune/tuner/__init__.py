@@ -34,11 +34,38 @@ Usage:
 
 __version__ = "1.0.0"
 
-from .config import TunerConfig, CoefficientConfig
-from .tuner import BayesianTunerCoordinator, run_tuner
-from .nt_interface import NetworkTablesInterface, ShotData
-from .optimizer import BayesianOptimizer, CoefficientTuner
-from .logger import TunerLogger, setup_logging
+import importlib
+
+# Public names and the submodule that defines each. Submodules are imported on
+# first attribute access (PEP 562) so importing e.g. TunerConfig doesn't pull in
+# NetworkTables or scikit-optimize.
+_LAZY_IMPORTS = {
+    'TunerConfig': 'config',
+    'CoefficientConfig': 'config',
+    'BayesianTunerCoordinator': 'tuner',
+    'run_tuner': 'tuner',
+    'NetworkTablesInterface': 'nt_interface',
+    'ShotData': 'nt_interface',
+    'BayesianOptimizer': 'optimizer',
+    'CoefficientTuner': 'optimizer',
+    'TunerLogger': 'logger',
+    'setup_logging': 'logger',
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access and cache the result."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     'TunerConfig',
@@ -21,16 +21,159 @@ From COEFFICIENT_TUNING.py:
     - COEFFICIENTS: Dictionary of tunable coefficients with their bounds
     - TUNING_ORDER: Order in which coefficients are optimized
     - Optimization parameters (N_INITIAL_POINTS, N_CALLS_PER_COEFFICIENT, etc.)
+
+INI helpers (also used by scripts/tuner_daemon.py for tuner_config.ini):
+    - parse_ini: Parse INI text into {section: {key: value}}
+    - get_bool / get_int: Typed lookups with a fallback for missing keys
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import os
-import configparser
-import importlib.util
+import re
+import sys
+import types
+
+__all__ = ['CoefficientConfig', 'TunerConfig', 'parse_ini', 'get_bool', 'get_int']
+
+
+# Config files live in ../config/ relative to this module
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_CONFIG_DIR = os.path.join(os.path.dirname(_MODULE_DIR), "config")
+_TOGGLES_FILE = os.path.join(_CONFIG_DIR, "TUNER_TOGGLES.ini")
+_COEFF_FILE = os.path.join(_CONFIG_DIR, "COEFFICIENT_TUNING.py")
+
+
+# Minimal INI reader for TUNER_TOGGLES.ini. The toggles file only needs
+# [section] headers and "key = value" lines, so this deliberately does NOT
+# support configparser features such as interpolation, multiline values,
+# inline comments or DEFAULT-section inheritance. Keys are lowercased like
+# configparser does; full-line comments start with '#' or ';'.
+# Both patterns are compiled once here and only ever match within a single line.
+_INI_SECTION_RE = re.compile(r'^[ \t]*\[([^\]\r\n]+)\][ \t]*$', re.MULTILINE)
+_INI_KV_RE = re.compile(r'^[ \t]*([^#;=:\s\[][^=:\r\n]*?)[ \t]*[=:][ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# Same accepted spellings as configparser.getboolean
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+def parse_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse INI text into a {section: {key: value}} dict.
+    
+    Args:
+        text: Contents of the INI file
+        
+    Returns:
+        Dict mapping section names to their key/value strings
+    """
+    data = {}
+    sections = list(_INI_SECTION_RE.finditer(text))
+    for i, section in enumerate(sections):
+        end = sections[i + 1].start() if i + 1 < len(sections) else len(text)
+        body = text[section.end():end]
+        data[section.group(1).strip()] = {
+            match.group(1).lower(): match.group(2)
+            for match in _INI_KV_RE.finditer(body)
+        }
+    return data
+
+
+def get_bool(data: Dict[str, Dict[str, str]], section: str, key: str, fallback: bool) -> bool:
+    """Read a boolean INI value, returning fallback if the key is missing."""
+    value = data.get(section, {}).get(key)
+    if value is None:
+        return fallback
+    try:
+        return _BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
+
+def get_int(data: Dict[str, Dict[str, str]], section: str, key: str, fallback: int) -> int:
+    """Read an integer INI value, returning fallback if the key is missing."""
+    value = data.get(section, {}).get(key)
+    if value is None:
+        return fallback
+    return int(value)
+
+
+def _read_toggles_file(path: str) -> Dict[str, Dict[str, str]]:
+    """Read and parse TUNER_TOGGLES.ini."""
+    with open(path, encoding='utf-8') as f:
+        return parse_ini(f.read())
+
+
+def _read_coefficient_file(path: str) -> Dict[str, Any]:
+    """
+    Read the upper-case settings from COEFFICIENT_TUNING.py without executing it.
+    
+    The file is parsed as data: every top-level NAME = value assignment must
+    be a plain literal (numbers, strings, booleans, lists, dicts).
+    
+    Args:
+        path: Path to COEFFICIENT_TUNING.py
+        
+    Returns:
+        Dict mapping setting names to their values
+    """
+    # Deferred so importing this module (e.g. for CoefficientConfig) stays cheap
+    import ast
+    
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    
+    settings = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id.isupper():
+                try:
+                    settings[target.id] = ast.literal_eval(node.value)
+                except ValueError:
+                    raise ValueError(
+                        f"{os.path.basename(path)} line {node.lineno}: "
+                        f"{target.id} must be a literal value"
+                    )
+    return settings
+
+
+# Parsed file contents keyed by path, stored as (mtime_ns, data) so that
+# building another TunerConfig only re-reads files that changed on disk.
+# Cached data is shared between instances and must be treated as read-only.
+_CONFIG_CACHE: Dict[str, Tuple[int, Any]] = {}
 
 
-@dataclass
+def _load_cached(path: str, reader: Callable[[str], Any]) -> Any:
+    """
+    Return reader(path), reusing the previous result if the file is unchanged.
+    
+    Args:
+        path: File to load
+        reader: Function that reads and parses the file
+        
+    Returns:
+        The parsed file contents
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = reader(path)
+    _CONFIG_CACHE[path] = (mtime, data)
+    return data
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CoefficientConfig:
     """
     Configuration for a single tunable coefficient.
@@ -50,6 +193,10 @@ class CoefficientConfig:
         autotune_shot_threshold: Per-coefficient sample size (only used if override=True)
         auto_advance_override: If True, use per-coefficient auto-advance setting instead of global
         auto_advance_on_success: Per-coefficient auto-advance on 100% success (only used if override=True)
+    
+    The local override settings are cached as tuples when the object is built.
+    Change them through set_local_autotune_threshold(), or call
+    refresh_effective_settings() after assigning the override fields directly.
     """
     
     name: str
@@ -69,6 +216,34 @@ class CoefficientConfig:
     auto_advance_override: bool = False  # If True, use custom settings below instead of global
     auto_advance_on_success: bool = False  # Auto-advance on 100% success (only used if override=True)
     auto_advance_shot_threshold: int = 10  # Custom threshold for auto-advance (only used if override=True)
+    # Precomputed local override settings (None when the coefficient uses global settings)
+    _local_autotune: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _local_auto_advance: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.refresh_effective_settings()
+    
+    def refresh_effective_settings(self):
+        """Recompute the cached local override settings from the override fields."""
+        self._local_autotune = (
+            (self.autotune_enabled, self.autotune_shot_threshold)
+            if self.autotune_override else None
+        )
+        self._local_auto_advance = (
+            (self.auto_advance_on_success, self.auto_advance_shot_threshold)
+            if self.auto_advance_override else None
+        )
+    
+    def set_local_autotune_threshold(self, threshold: int):
+        """
+        Override the autotune shot threshold for this coefficient only.
+        
+        Args:
+            threshold: New local shot threshold
+        """
+        self.autotune_override = True
+        self.autotune_shot_threshold = threshold
+        self.refresh_effective_settings()
     
     def clamp(self, value: float) -> float:
         """
@@ -80,11 +255,34 @@ class CoefficientConfig:
         Returns:
             Value clamped to [min_value, max_value], rounded if is_integer=True
         """
-        clamped = max(self.min_value, min(self.max_value, value))
+        # Same result as max(min_value, min(max_value, value)), including for NaN,
+        # without the two builtin calls
+        hi = self.max_value
+        clamped = value if value < hi else hi
+        lo = self.min_value
+        clamped = clamped if clamped > lo else lo
         if self.is_integer:
             clamped = round(clamped)
         return clamped
     
+    def clamp_array(self, values):
+        """
+        Clamp an array of candidate values in one vectorized call.
+        
+        Args:
+            values: Array-like of values to clamp
+        
+        Returns:
+            numpy array clamped to [min_value, max_value], rounded if is_integer=True
+        """
+        # Imported here so loading the config never pulls in numpy
+        import numpy as np
+        
+        clamped = np.clip(values, self.min_value, self.max_value)
+        if self.is_integer:
+            clamped = np.rint(clamped)
+        return clamped
+    
     def get_effective_autotune_settings(self, global_enabled: bool, global_threshold: int, force_global: bool = False) -> tuple:
         """
         Get the effective autotune settings for this coefficient.
@@ -99,15 +297,48 @@ class CoefficientConfig:
         Returns:
             Tuple of (autotune_enabled, autotune_shot_threshold) to use for this coefficient
         """
-        if force_global:
-            # Force global: ignore all local overrides
-            return (global_enabled, global_threshold)
-        elif self.autotune_override:
-            # Local override takes precedence over global default
-            return (self.autotune_enabled, self.autotune_shot_threshold)
-        else:
-            # Use global default
+        local = self._local_autotune
+        if force_global or local is None:
+            # Forced or default global settings
             return (global_enabled, global_threshold)
+        # Local override takes precedence over global default
+        return local
+    
+    def get_effective_autotune_enabled(self, global_enabled: bool, force_global: bool = False) -> bool:
+        """
+        Get the effective autotune enabled setting for this coefficient.
+        
+        Priority: force_global > local override > global default
+        
+        Args:
+            global_enabled: Global autotune_enabled from TUNER_TOGGLES.ini
+            force_global: If True, ignores local override and uses global settings
+            
+        Returns:
+            Whether autotune is enabled for this coefficient
+        """
+        local = self._local_autotune
+        if force_global or local is None:
+            return global_enabled
+        return local[0]
+    
+    def get_effective_autotune_threshold(self, global_threshold: int, force_global: bool = False) -> int:
+        """
+        Get the effective autotune shot threshold for this coefficient.
+        
+        Priority: force_global > local override > global default
+        
+        Args:
+            global_threshold: Global autotune_shot_threshold from TUNER_TOGGLES.ini
+            force_global: If True, ignores local override and uses global settings
+            
+        Returns:
+            Number of shots before autotune runs for this coefficient
+        """
+        local = self._local_autotune
+        if force_global or local is None:
+            return global_threshold
+        return local[1]
     
     def get_effective_auto_advance_settings(self, global_auto_advance: bool, global_threshold: int, force_global: bool = False) -> tuple:
         """
@@ -123,15 +354,12 @@ class CoefficientConfig:
         Returns:
             Tuple of (auto_advance_enabled, auto_advance_shot_threshold) to use for this coefficient
         """
-        if force_global:
-            # Force global: ignore all local overrides
-            return (global_auto_advance, global_threshold)
-        elif self.auto_advance_override:
-            # Local override takes precedence over global default
-            return (self.auto_advance_on_success, self.auto_advance_shot_threshold)
-        else:
-            # Use global default
+        local = self._local_auto_advance
+        if force_global or local is None:
+            # Forced or default global settings
             return (global_auto_advance, global_threshold)
+        # Local override takes precedence over global default
+        return local
     
     def get_effective_auto_advance(self, global_auto_advance: bool, force_global: bool = False) -> bool:
         """
@@ -146,12 +374,59 @@ class CoefficientConfig:
         Returns:
             Whether to auto-advance on 100% success for this coefficient
         """
-        if force_global:
-            return global_auto_advance
-        elif self.auto_advance_override:
-            return self.auto_advance_on_success
-        else:
+        local = self._local_auto_advance
+        if force_global or local is None:
             return global_auto_advance
+        return local[0]
+
+
+# NetworkTables keys for shot data, set on every TunerConfig as NT_<name>
+_NT_KEYS = {
+    'SHOT_DATA_TABLE': "/FiringSolver",
+    'SHOT_HIT_KEY': "/FiringSolver/Hit",
+    'SHOT_DISTANCE_KEY': "/FiringSolver/Distance",
+    'SHOT_ANGLE_KEY': "/FiringSolver/Solution/pitchRadians",
+    'SHOT_VELOCITY_KEY': "/FiringSolver/Solution/exitVelocity",
+    'TUNER_STATUS_KEY': "/FiringSolver/TunerStatus",
+    # Match mode detection key
+    'MATCH_MODE_KEY': "/FMSInfo/FMSControlData",
+}
+
+
+@lru_cache(maxsize=None)
+def _nt_server_ip(team_number: int) -> str:
+    """Return the roboRIO address for a team number (10.TE.AM.2)."""
+    return f"10.{team_number // 100}.{team_number % 100}.2"
+
+
+# Defaults for optional per-coefficient keys in COEFFICIENT_TUNING.py
+_COEFF_DEFAULTS = {
+    'autotune_override': False,
+    'autotune_enabled': False,
+    'autotune_shot_threshold': 10,
+    'auto_advance_override': False,
+    'auto_advance_on_success': False,
+    'auto_advance_shot_threshold': 10,
+}
+
+
+# TunerConfig attributes populated from COEFFICIENT_TUNING.py, loaded on first access
+_COEFFICIENT_ATTRS = frozenset({
+    'TUNING_ORDER',
+    'COEFFICIENTS',
+    'N_INITIAL_POINTS',
+    'N_CALLS_PER_COEFFICIENT',
+    'MAX_NT_WRITE_RATE_HZ',
+    'MAX_NT_READ_RATE_HZ',
+    'NT_BATCH_WRITES',
+    'PHYSICAL_MAX_VELOCITY_MPS',
+    'PHYSICAL_MIN_VELOCITY_MPS',
+    'PHYSICAL_MAX_ANGLE_RAD',
+    'PHYSICAL_MIN_ANGLE_RAD',
+    'PHYSICAL_MAX_DISTANCE_M',
+    'PHYSICAL_MIN_DISTANCE_M',
+    '_enabled_in_order',
+})
 
 
 class TunerConfig:
@@ -168,8 +443,11 @@ class TunerConfig:
                                   if False, wait for dashboard button press
         AUTOTUNE_SHOT_THRESHOLD (int): Number of shots to collect before 
                                         automatic optimization (sample size)
-        COEFFICIENTS (dict): Map of coefficient names to CoefficientConfig objects
-        TUNING_ORDER (list): Order in which to optimize coefficients
+        COEFFICIENTS (Mapping): Read-only map of coefficient names to CoefficientConfig objects
+        TUNING_ORDER (tuple): Order in which to optimize coefficients
+    
+    Settings from COEFFICIENT_TUNING.py are loaded the first time one of them
+    is accessed, so callers that only need the toggles never execute it.
     """
     
     def __init__(self):
@@ -177,12 +455,17 @@ class TunerConfig:
         # Load toggle settings from TUNER_TOGGLES.ini
         self._load_toggles()
         
-        # Load coefficient configuration from COEFFICIENT_TUNING.py
-        self._load_coefficient_config()
-        
         # Initialize other settings
         self._initialize_constants()
     
+    def __getattr__(self, name):
+        """Load COEFFICIENT_TUNING.py on first access to one of its settings."""
+        # Only called when normal lookup fails, i.e. before the coefficients are loaded
+        if name in _COEFFICIENT_ATTRS and not self.__dict__.get('_coefficients_loaded', False):
+            self._load_coefficient_config()
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
     def _load_toggles(self):
         """
         Load the main toggles from TUNER_TOGGLES.ini.
@@ -199,91 +482,97 @@ class TunerConfig:
         - REQUIRE_COEFFICIENTS_UPDATED: Coefficient interlock
         - NT_SERVER_IP: Calculated from team number
         """
-        # Find the toggles file (in ../config/ relative to tuner module)
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(module_dir)
-        toggles_file = os.path.join(parent_dir, "config", "TUNER_TOGGLES.ini")
-        
-        config = configparser.ConfigParser()
-        config.read(toggles_file)
+        # A missing file behaves like an empty one (all fallbacks), as with configparser
+        try:
+            config = _load_cached(_TOGGLES_FILE, _read_toggles_file)
+        except FileNotFoundError:
+            config = {}
         
         # ── Master Switch ──
-        self.TUNER_ENABLED = config.getboolean('main_controls', 'tuner_enabled', fallback=True)
+        self.TUNER_ENABLED = get_bool(config, 'main_controls', 'tuner_enabled', fallback=True)
         
         # ── Autotune Settings ──
-        self.AUTOTUNE_ENABLED = config.getboolean('main_controls', 'autotune_enabled', fallback=False)
-        self.AUTOTUNE_SHOT_THRESHOLD = config.getint('main_controls', 'autotune_shot_threshold', fallback=10)
+        self.AUTOTUNE_ENABLED = get_bool(config, 'main_controls', 'autotune_enabled', fallback=False)
+        self.AUTOTUNE_SHOT_THRESHOLD = get_int(config, 'main_controls', 'autotune_shot_threshold', fallback=10)
         # FORCE_GLOBAL: When True, ignores ALL local coefficient overrides for autotune
-        self.AUTOTUNE_FORCE_GLOBAL = config.getboolean('main_controls', 'autotune_force_global', fallback=False)
+        self.AUTOTUNE_FORCE_GLOBAL = get_bool(config, 'main_controls', 'autotune_force_global', fallback=False)
         
         # ── Auto-Advance Settings ──
-        self.AUTO_ADVANCE_ON_SUCCESS = config.getboolean('main_controls', 'auto_advance_on_success', fallback=False)
-        self.AUTO_ADVANCE_SHOT_THRESHOLD = config.getint('main_controls', 'auto_advance_shot_threshold', fallback=10)
+        self.AUTO_ADVANCE_ON_SUCCESS = get_bool(config, 'main_controls', 'auto_advance_on_success', fallback=False)
+        self.AUTO_ADVANCE_SHOT_THRESHOLD = get_int(config, 'main_controls', 'auto_advance_shot_threshold', fallback=10)
         # FORCE_GLOBAL: When True, ignores ALL local coefficient overrides for auto-advance
-        self.AUTO_ADVANCE_FORCE_GLOBAL = config.getboolean('main_controls', 'auto_advance_force_global', fallback=False)
+        self.AUTO_ADVANCE_FORCE_GLOBAL = get_bool(config, 'main_controls', 'auto_advance_force_global', fallback=False)
         
         # ── Shooting Interlocks ──
-        self.REQUIRE_SHOT_LOGGED = config.getboolean('main_controls', 'require_shot_logged', fallback=False)
-        self.REQUIRE_COEFFICIENTS_UPDATED = config.getboolean('main_controls', 'require_coefficients_updated', fallback=False)
+        self.REQUIRE_SHOT_LOGGED = get_bool(config, 'main_controls', 'require_shot_logged', fallback=False)
+        self.REQUIRE_COEFFICIENTS_UPDATED = get_bool(config, 'main_controls', 'require_coefficients_updated', fallback=False)
         
         # ── Team/Network Configuration ──
-        team_number = config.getint('team', 'team_number', fallback=5892)
-        self.NT_SERVER_IP = f"10.{team_number // 100}.{team_number % 100}.2"
+        team_number = get_int(config, 'team', 'team_number', fallback=5892)
+        self.NT_SERVER_IP = _nt_server_ip(team_number)
     
     def _load_coefficient_config(self):
         """Load coefficient definitions from COEFFICIENT_TUNING.py"""
-        # Find the coefficient config file (in ../config/ relative to tuner module)
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(module_dir)
-        coeff_file = os.path.join(parent_dir, "config", "COEFFICIENT_TUNING.py")
+        # Settings are cached per file; CoefficientConfig objects are mutable,
+        # so every TunerConfig still builds its own
+        coeff = _load_cached(_COEFF_FILE, _read_coefficient_file)
         
-        # Load as module
-        spec = importlib.util.spec_from_file_location("coeff_config", coeff_file)
-        coeff_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(coeff_module)
-        
-        # Load tuning order
-        self.TUNING_ORDER = coeff_module.TUNING_ORDER
+        # Load tuning order (names are interned since they are hashed and compared constantly)
+        self.TUNING_ORDER = tuple(sys.intern(name) for name in coeff['TUNING_ORDER'])
         
         # Convert coefficient dicts to CoefficientConfig objects
-        self.COEFFICIENTS = {}
-        for name, cfg in coeff_module.COEFFICIENTS.items():
-            self.COEFFICIENTS[name] = CoefficientConfig(
-                name=name,
-                default_value=cfg['default_value'],
-                min_value=cfg['min_value'],
-                max_value=cfg['max_value'],
-                initial_step_size=cfg['initial_step_size'],
-                step_decay_rate=cfg['step_decay_rate'],
-                is_integer=cfg['is_integer'],
-                enabled=cfg['enabled'],
-                nt_key=cfg['nt_key'],
-                # Per-coefficient autotune settings (default to global if not specified)
-                autotune_override=cfg.get('autotune_override', False),
-                autotune_enabled=cfg.get('autotune_enabled', False),
-                autotune_shot_threshold=cfg.get('autotune_shot_threshold', 10),
+        coefficients = {}
+        for name, cfg in coeff['COEFFICIENTS'].items():
+            name = sys.intern(name)
+            # Entries may also carry keys CoefficientConfig doesn't take (e.g. description)
+            cfg = {**_COEFF_DEFAULTS, **cfg}
+            # Positional in CoefficientConfig field order (cheaper than 15 keyword arguments)
+            coefficients[name] = CoefficientConfig(
+                name,
+                cfg['default_value'],
+                cfg['min_value'],
+                cfg['max_value'],
+                cfg['initial_step_size'],
+                cfg['step_decay_rate'],
+                cfg['is_integer'],
+                cfg['enabled'],
+                cfg['nt_key'],
+                # Per-coefficient autotune settings (see _COEFF_DEFAULTS when not specified)
+                cfg['autotune_override'],
+                cfg['autotune_enabled'],
+                cfg['autotune_shot_threshold'],
                 # Per-coefficient auto-advance settings
-                auto_advance_override=cfg.get('auto_advance_override', False),
-                auto_advance_on_success=cfg.get('auto_advance_on_success', False),
-                auto_advance_shot_threshold=cfg.get('auto_advance_shot_threshold', 10),
+                cfg['auto_advance_override'],
+                cfg['auto_advance_on_success'],
+                cfg['auto_advance_shot_threshold'],
             )
+        # Read-only view: the set of coefficients and their order are fixed once loaded
+        self.COEFFICIENTS = types.MappingProxyType(coefficients)
         
         # Load optimization settings
-        self.N_INITIAL_POINTS = coeff_module.N_INITIAL_POINTS
-        self.N_CALLS_PER_COEFFICIENT = coeff_module.N_CALLS_PER_COEFFICIENT
+        self.N_INITIAL_POINTS = coeff['N_INITIAL_POINTS']
+        self.N_CALLS_PER_COEFFICIENT = coeff['N_CALLS_PER_COEFFICIENT']
         
         # Load RoboRIO protection settings
-        self.MAX_NT_WRITE_RATE_HZ = coeff_module.MAX_WRITE_RATE_HZ
-        self.MAX_NT_READ_RATE_HZ = coeff_module.MAX_READ_RATE_HZ
-        self.NT_BATCH_WRITES = coeff_module.BATCH_WRITES
+        self.MAX_NT_WRITE_RATE_HZ = coeff['MAX_WRITE_RATE_HZ']
+        self.MAX_NT_READ_RATE_HZ = coeff['MAX_READ_RATE_HZ']
+        self.NT_BATCH_WRITES = coeff['BATCH_WRITES']
         
         # Load physical limits
-        self.PHYSICAL_MAX_VELOCITY_MPS = coeff_module.PHYSICAL_MAX_VELOCITY_MPS
-        self.PHYSICAL_MIN_VELOCITY_MPS = coeff_module.PHYSICAL_MIN_VELOCITY_MPS
-        self.PHYSICAL_MAX_ANGLE_RAD = coeff_module.PHYSICAL_MAX_ANGLE_RAD
-        self.PHYSICAL_MIN_ANGLE_RAD = coeff_module.PHYSICAL_MIN_ANGLE_RAD
-        self.PHYSICAL_MAX_DISTANCE_M = coeff_module.PHYSICAL_MAX_DISTANCE_M
-        self.PHYSICAL_MIN_DISTANCE_M = coeff_module.PHYSICAL_MIN_DISTANCE_M
+        self.PHYSICAL_MAX_VELOCITY_MPS = coeff['PHYSICAL_MAX_VELOCITY_MPS']
+        self.PHYSICAL_MIN_VELOCITY_MPS = coeff['PHYSICAL_MIN_VELOCITY_MPS']
+        self.PHYSICAL_MAX_ANGLE_RAD = coeff['PHYSICAL_MAX_ANGLE_RAD']
+        self.PHYSICAL_MIN_ANGLE_RAD = coeff['PHYSICAL_MIN_ANGLE_RAD']
+        self.PHYSICAL_MAX_DISTANCE_M = coeff['PHYSICAL_MAX_DISTANCE_M']
+        self.PHYSICAL_MIN_DISTANCE_M = coeff['PHYSICAL_MIN_DISTANCE_M']
+        
+        # Enabled flags and order are fixed once loaded, so resolve them once
+        coefficients = (self.COEFFICIENTS.get(name) for name in self.TUNING_ORDER)
+        self._enabled_in_order = tuple(
+            coeff for coeff in coefficients if coeff is not None and coeff.enabled
+        )
+        
+        self._coefficients_loaded = True
     
     def _initialize_constants(self):
         """Initialize constants that don't come from config files."""
@@ -291,16 +580,9 @@ class TunerConfig:
         self.NT_TIMEOUT_SECONDS = 5.0
         self.NT_RECONNECT_DELAY_SECONDS = 2.0
         
-        # NetworkTables keys for shot data
-        self.NT_SHOT_DATA_TABLE = "/FiringSolver"
-        self.NT_SHOT_HIT_KEY = "/FiringSolver/Hit"
-        self.NT_SHOT_DISTANCE_KEY = "/FiringSolver/Distance"
-        self.NT_SHOT_ANGLE_KEY = "/FiringSolver/Solution/pitchRadians"
-        self.NT_SHOT_VELOCITY_KEY = "/FiringSolver/Solution/exitVelocity"
-        self.NT_TUNER_STATUS_KEY = "/FiringSolver/TunerStatus"
-        
-        # Match mode detection key
-        self.NT_MATCH_MODE_KEY = "/FMSInfo/FMSControlData"
+        # NetworkTables keys for shot data and match mode detection
+        for key, path in _NT_KEYS.items():
+            setattr(self, f"NT_{key}", path)
         
         # Bayesian optimization settings
         self.ACQUISITION_FUNCTION = "EI"  # Expected Improvement
@@ -318,6 +600,7 @@ class TunerConfig:
         # Threading configuration
         self.TUNER_UPDATE_RATE_HZ = 10.0  # How often to check for new data
         self.GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+        self.HEARTBEAT_INTERVAL_SECONDS = 1.0  # Robot treats the tuner as gone after 5s
         
         # Step size decay configuration
         self.STEP_SIZE_DECAY_ENABLED = True
@@ -325,11 +608,7 @@ class TunerConfig:
     
     def get_enabled_coefficients_in_order(self) -> List[CoefficientConfig]:
         """Get list of enabled coefficients in tuning order."""
-        return [
-            self.COEFFICIENTS[name]
-            for name in self.TUNING_ORDER
-            if name in self.COEFFICIENTS and self.COEFFICIENTS[name].enabled
-        ]
+        return list(self._enabled_in_order)
     
     def validate_config(self) -> List[str]:
         """
@@ -338,58 +617,65 @@ class TunerConfig:
         Returns:
             List of warning messages (empty if no issues)
         """
-        warnings = []
-        
-        # Check that enabled coefficients are in tuning order
-        enabled_coeffs = [name for name, cfg in self.COEFFICIENTS.items() if cfg.enabled]
-        for name in enabled_coeffs:
-            if name not in self.TUNING_ORDER:
-                warnings.append(f"Enabled coefficient '{name}' not in TUNING_ORDER")
-        
-        # Check for coefficients in tuning order that don't exist
-        for name in self.TUNING_ORDER:
-            if name not in self.COEFFICIENTS:
-                warnings.append(f"Coefficient '{name}' in TUNING_ORDER but not defined")
-        
-        # Validate coefficient configurations
-        for name, coeff in self.COEFFICIENTS.items():
-            if coeff.min_value >= coeff.max_value:
-                warnings.append(f"{name}: min_value must be < max_value")
+        return list(self._iter_warnings())
+    
+    def has_warnings(self) -> bool:
+        """Return True if validation finds any issue, stopping at the first one."""
+        return next(self._iter_warnings(), None) is not None
+    
+    def _iter_warnings(self) -> Iterator[str]:
+        """Yield configuration warning messages one at a time."""
+        coeffs = self.COEFFICIENTS
+        order = self.TUNING_ORDER
+        order_set = frozenset(order)
+        
+        # Validate coefficient configurations, checking tuning order in the same pass
+        for name, coeff in coeffs.items():
+            if coeff.enabled and name not in order_set:
+                yield f"Enabled coefficient '{name}' not in TUNING_ORDER"
+            
+            min_value = coeff.min_value
+            max_value = coeff.max_value
+            if min_value >= max_value:
+                yield f"{name}: min_value must be < max_value"
             
-            if coeff.default_value < coeff.min_value or coeff.default_value > coeff.max_value:
-                warnings.append(f"{name}: default_value outside valid range")
+            if coeff.default_value < min_value or coeff.default_value > max_value:
+                yield f"{name}: default_value outside valid range"
             
             if coeff.initial_step_size <= 0:
-                warnings.append(f"{name}: initial_step_size must be positive")
+                yield f"{name}: initial_step_size must be positive"
             
             if not 0 < coeff.step_decay_rate <= 1.0:
-                warnings.append(f"{name}: step_decay_rate must be in (0, 1]")
+                yield f"{name}: step_decay_rate must be in (0, 1]"
+        
+        # Check for coefficients in tuning order that don't exist
+        for name in order:
+            if name not in coeffs:
+                yield f"Coefficient '{name}' in TUNING_ORDER but not defined"
         
         # Validate physical limits make sense
         if self.PHYSICAL_MIN_VELOCITY_MPS >= self.PHYSICAL_MAX_VELOCITY_MPS:
-            warnings.append("PHYSICAL_MIN_VELOCITY_MPS >= PHYSICAL_MAX_VELOCITY_MPS")
+            yield "PHYSICAL_MIN_VELOCITY_MPS >= PHYSICAL_MAX_VELOCITY_MPS"
         
         if self.PHYSICAL_MIN_ANGLE_RAD >= self.PHYSICAL_MAX_ANGLE_RAD:
-            warnings.append("PHYSICAL_MIN_ANGLE_RAD >= PHYSICAL_MAX_ANGLE_RAD")
+            yield "PHYSICAL_MIN_ANGLE_RAD >= PHYSICAL_MAX_ANGLE_RAD"
         
         if self.PHYSICAL_MIN_DISTANCE_M >= self.PHYSICAL_MAX_DISTANCE_M:
-            warnings.append("PHYSICAL_MIN_DISTANCE_M >= PHYSICAL_MAX_DISTANCE_M")
+            yield "PHYSICAL_MIN_DISTANCE_M >= PHYSICAL_MAX_DISTANCE_M"
         
         # Validate system parameters
         if self.N_INITIAL_POINTS < 1:
-            warnings.append("N_INITIAL_POINTS must be >= 1")
+            yield "N_INITIAL_POINTS must be >= 1"
         
         if self.N_CALLS_PER_COEFFICIENT < self.N_INITIAL_POINTS:
-            warnings.append("N_CALLS_PER_COEFFICIENT must be >= N_INITIAL_POINTS")
+            yield "N_CALLS_PER_COEFFICIENT must be >= N_INITIAL_POINTS"
         
         if self.TUNER_UPDATE_RATE_HZ <= 0:
-            warnings.append("TUNER_UPDATE_RATE_HZ must be positive")
+            yield "TUNER_UPDATE_RATE_HZ must be positive"
         
         # Validate rate limiting parameters to prevent division by zero
         if self.MAX_NT_WRITE_RATE_HZ <= 0:
-            warnings.append("MAX_NT_WRITE_RATE_HZ must be positive")
+            yield "MAX_NT_WRITE_RATE_HZ must be positive"
         
         if self.MAX_NT_READ_RATE_HZ <= 0:
-            warnings.append("MAX_NT_READ_RATE_HZ must be positive")
-        
-        return warnings
+            yield "MAX_NT_READ_RATE_HZ must be positive"
@@ -12,8 +12,7 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
-import queue
+import collections
 import sys
 import time
 from pathlib import Path
@@ -21,8 +20,56 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from MLtune.tuner.config import TunerConfig
-from MLtune.tuner.tuner import BayesianTunerCoordinator
+# TunerConfig and BayesianTunerCoordinator are imported in _start_tuner: the
+# coordinator pulls in the optimizer stack, and deferring it lets the window
+# appear before those imports run.
+
+# Log widget size limit: once it passes LOG_MAX_LINES, trim back to LOG_KEEP_LINES
+LOG_MAX_LINES = 2500
+LOG_KEEP_LINES = 2000
+
+# Polling backs off from the minimum interval (ms), doubling up to the maximum
+# while nothing changes, and drops back to the minimum as soon as something does
+POLL_MIN_MS = 100
+POLL_MAX_MS = 1000
+
+# Connection state rarely flips, so it is checked less often than the other widgets
+CONNECTION_CHECK_INTERVAL_S = 1.0
+
+# Log levels double as Text tag names; queued messages carry the index
+_TAG_NAMES = ("info", "success", "warning", "error")
+_TAG_INDEX = {name: index for index, name in enumerate(_TAG_NAMES)}
+
+# Static multi-line log blocks, each queued as a single message
+_BANNER = "\n".join([
+    "═" * 60,
+    "  BAYESIAN OPTIMIZATION TUNER",
+    "  Runs on your laptop - connects to robot via NetworkTables",
+    "═" * 60,
+    "",
+    "Starting automatically...",
+])
+
+_CONNECT_CHECKLIST = "\n".join([
+    "",
+    "Connecting to robot via NetworkTables...",
+    "  Make sure:",
+    "  1. Robot is powered on",
+    "  2. Laptop is connected to robot network",
+    "  3. Robot code is running",
+])
+
+_DASHBOARD_HELP = "\n".join([
+    "",
+    "Dashboard Controls at /Tuning/BayesianTuner/:",
+    "  • TunerEnabled - Toggle system on/off",
+    "  • RunOptimization - Manual trigger (when autotune OFF)",
+    "  • SkipToNextCoefficient - Skip (when auto-advance OFF)",
+    "  • ManualControl/ - Adjust any coefficient",
+    "  • FineTuning/ - Aim bias adjustment",
+    "  • Backtrack/ - Re-tune earlier coefficients",
+    "",
+])
 
 
 class TunerGUI:
@@ -55,8 +102,20 @@ class TunerGUI:
         self.config = None
         self.running = False
         self.connected = False
-        self.log_queue = queue.Queue()
-        self.update_thread = None
+        # Set while/after stopping so a second stop (e.g. window close) is a no-op
+        self._stopping = False
+        # deque append/popleft are atomic, so background threads can log without a lock
+        self.log_queue = collections.deque()
+        # Last options written to each status widget by _update_ui
+        self._ui_cache = {}
+        self._ui_interval = POLL_MIN_MS
+        self._log_interval = POLL_MIN_MS
+        self._last_connection_check = 0.0
+        # Connection states pushed by the NetworkTables listener (on the NT thread),
+        # applied by _update_ui on the Tk thread
+        self._connection_events = collections.deque()
+        # True once the listener has reported, so no polling is needed
+        self._connection_listener_reported = False
         
         # Build UI
         self._build_ui()
@@ -177,23 +236,60 @@ class TunerGUI:
     
     def _log(self, message, level="info"):
         """Add a message to the log queue."""
-        self.log_queue.put((message, level))
+        # Stamp with the enqueue second; it is formatted when the queue is drained
+        # Unknown levels fall back to "info"
+        self.log_queue.append((message, _TAG_INDEX.get(level, 0), int(time.time())))
     
     def _consume_logs(self):
         """Consume log messages from the queue and display them."""
-        try:
-            while True:
-                message, level = self.log_queue.get_nowait()
-                self.log_text.configure(state=tk.NORMAL)
-                timestamp = time.strftime("%H:%M:%S")
-                self.log_text.insert(tk.END, f"[{timestamp}] {message}\n", level)
-                self.log_text.see(tk.END)
-                self.log_text.configure(state=tk.DISABLED)
-        except queue.Empty:
-            pass
+        # Drain everything queued since the last check
+        messages = []
+        while True:
+            try:
+                messages.append(self.log_queue.popleft())
+            except IndexError:
+                break
+        
+        if messages:
+            # One insert for the whole batch: Text.insert takes alternating text, tag
+            # arguments, so each message keeps its own color
+            chunks = []
+            last_second = None
+            tag_names = _TAG_NAMES
+            for message, tag_index, second in messages:
+                # Bursts share a second, so format each distinct second only once
+                if second != last_second:
+                    timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+                    last_second = second
+                chunks.append(f"[{timestamp}] {message}\n")
+                chunks.append(tag_names[tag_index])
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.insert(tk.END, *chunks)
+            # Keep long tuning sessions from growing the widget without bound
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_KEEP_LINES}.0')
+            self.log_text.see(tk.END)
+            self.log_text.configure(state=tk.DISABLED)
+            self._log_interval = POLL_MIN_MS
+        else:
+            self._log_interval = min(self._log_interval * 2, POLL_MAX_MS)
         
         # Schedule next check
-        self.root.after(100, self._consume_logs)
+        self.root.after(self._log_interval, self._consume_logs)
+    
+    def _set_widget(self, key, widget, **options):
+        """
+        Configure a widget only if the options differ from the last write.
+        
+        Returns:
+            True if the widget was updated
+        """
+        if self._ui_cache.get(key) == options:
+            return False
+        widget.configure(**options)
+        self._ui_cache[key] = options
+        return True
     
     def _clear_log(self):
         """Clear the log output."""
@@ -203,12 +299,7 @@ class TunerGUI:
     
     def _auto_start(self):
         """Automatically start the tuner on launch."""
-        self._log("═" * 60, "info")
-        self._log("  BAYESIAN OPTIMIZATION TUNER", "info")
-        self._log("  Runs on your laptop - connects to robot via NetworkTables", "info")
-        self._log("═" * 60, "info")
-        self._log("", "info")
-        self._log("Starting automatically...", "info")
+        self._log(_BANNER, "info")
         self._toggle_tuner()
     
     def _toggle_tuner(self):
@@ -220,9 +311,11 @@ class TunerGUI:
     
     def _start_tuner(self):
         """Start the tuner."""
+        self._stopping = False
         self._log("Loading configuration...", "info")
         
         try:
+            from MLtune.tuner.config import TunerConfig
             self.config = TunerConfig()
             self._log(f"  ✓ Loaded {len(self.config.COEFFICIENTS)} coefficients", "success")
             self._log(f"  ✓ Tuning order: {self.config.TUNING_ORDER}", "success")
@@ -233,18 +326,14 @@ class TunerGUI:
         
         self._log("Initializing tuner...", "info")
         try:
+            from MLtune.tuner.tuner import BayesianTunerCoordinator
             self.tuner = BayesianTunerCoordinator(self.config)
             self._log("  ✓ Tuner initialized", "success")
         except Exception as e:
             self._log(f"  ✗ ERROR initializing tuner: {e}", "error")
             return
         
-        self._log("", "info")
-        self._log("Connecting to robot via NetworkTables...", "info")
-        self._log("  Make sure:", "info")
-        self._log("  1. Robot is powered on", "info")
-        self._log("  2. Laptop is connected to robot network", "info")
-        self._log("  3. Robot code is running", "info")
+        self._log(_CONNECT_CHECKLIST, "info")
         
         try:
             self.tuner.start()
@@ -259,19 +348,18 @@ class TunerGUI:
             self._log(f"  ⚠ Connection pending: {e}", "warning")
             self._log("  Will keep trying to connect...", "info")
         
+        # Have NetworkTables push connection changes instead of polling for them.
+        # The listener runs on the NT thread and Tk is not thread-safe, so it only
+        # queues the state for _update_ui.
+        self._connection_events.clear()
+        self._connection_listener_reported = False
+        self.tuner.nt_interface.add_connection_listener(self._connection_events.append)
+        
         # Get log directory from coordinator's logger
         log_dir = self.tuner.data_logger.log_directory
         self._log(f"  ✓ Logs will be saved to: {log_dir}", "success")
         
-        self._log("", "info")
-        self._log("Dashboard Controls at /Tuning/BayesianTuner/:", "info")
-        self._log("  • TunerEnabled - Toggle system on/off", "info")
-        self._log("  • RunOptimization - Manual trigger (when autotune OFF)", "info")
-        self._log("  • SkipToNextCoefficient - Skip (when auto-advance OFF)", "info")
-        self._log("  • ManualControl/ - Adjust any coefficient", "info")
-        self._log("  • FineTuning/ - Aim bias adjustment", "info")
-        self._log("  • Backtrack/ - Re-tune earlier coefficients", "info")
-        self._log("", "info")
+        self._log(_DASHBOARD_HELP, "info")
         self._log("Tuner is now running!", "success")
         self._log("=" * 60, "info")
         
@@ -280,15 +368,17 @@ class TunerGUI:
         self.start_button.configure(text="Stop Tuner")
         self.status_label.configure(text="Running", foreground="green")
         
-        # Start update thread
-        self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.update_thread.start()
+        self._ui_interval = POLL_MIN_MS
         
-        # Start UI update
-        self._update_ui()
+        # Start UI update (polled on the Tk main loop; the coordinator runs its own thread).
+        # The first tick waits for idle so the startup log and button state paint first.
+        self.root.after_idle(self._update_ui)
     
     def _stop_tuner(self):
         """Stop the tuner."""
+        if self._stopping:
+            return
+        self._stopping = True
         self._log("Stopping tuner...", "info")
         self.running = False
         
@@ -298,8 +388,13 @@ class TunerGUI:
                 self._log("  ✓ Tuner stopped and logs saved", "success")
             except Exception as e:
                 self._log(f"  ✗ Error stopping tuner: {e}", "error")
+            # The coordinator only stops NetworkTables if it fully started,
+            # so remove the listener here too
+            self.tuner.nt_interface.remove_connection_listeners()
         
         self.connected = False
+        self._connection_events.clear()
+        self._connection_listener_reported = False
         self.connection_label.configure(text="Disconnected", foreground="red")
         self.status_label.configure(text="Stopped", foreground="gray")
         self.start_button.configure(text="Start Tuner")
@@ -307,69 +402,82 @@ class TunerGUI:
         self.shots_label.configure(text="0 / 10")
         self.progress_bar['value'] = 0
         self.mode_label.configure(text="--")
+        self._ui_cache.clear()
         
         self._log("Tuner stopped.", "info")
     
-    def _update_loop(self):
-        """Background thread that runs the tuner update loop."""
-        # BayesianTunerCoordinator runs its own thread, so we just keep the GUI alive
-        # and check if we need to update connection status
-        while self.running:
-            try:
-                if self.tuner and self.tuner.nt_interface:
-                    # The tuner is running its own thread internally
-                    # We just sleep here to keep the GUI thread responsive
-                    pass
-                time.sleep(0.5)
-            except Exception as e:
-                self._log(f"Error in update loop: {e}", "error")
-                time.sleep(1)
-    
     def _update_ui(self):
         """Update UI elements with current tuner state."""
         if not self.running:
             return
         
-        if self.tuner:
+        changed = False
+        tuner = self.tuner
+        if tuner:
             try:
                 # Update current coefficient
-                current_coeff = self.tuner.optimizer.get_current_coefficient_name()
-                if current_coeff:
-                    self.coeff_label.configure(text=current_coeff)
-                else:
-                    self.coeff_label.configure(text="--")
+                # (widgets are only touched when their value changed since the last tick)
+                current_coeff = tuner.optimizer.get_current_coefficient_name()
+                changed |= self._set_widget('coeff', self.coeff_label, text=current_coeff or "--")
                 
                 # Update shot count using public methods
-                shots = self.tuner.get_accumulated_shots_count()
-                autotune, threshold = self.tuner.get_current_autotune_settings()
-                self.shots_label.configure(text=f"{shots} / {threshold}")
-                
-                # Update progress bar
-                progress = (shots / threshold * 100) if threshold > 0 else 0
-                self.progress_bar['value'] = min(progress, 100)
+                shots = tuner.get_accumulated_shots_count()
+                autotune, threshold = tuner.get_current_autotune_settings()
+                # Shot text and progress only depend on these two numbers
+                shots_key = (shots, threshold)
+                if self._ui_cache.get('shots_key') != shots_key:
+                    self._ui_cache['shots_key'] = shots_key
+                    changed |= self._set_widget('shots', self.shots_label, text=f"{shots} / {threshold}")
+                    
+                    # Update progress bar (rounded to whole percent so tiny changes skip a redraw)
+                    progress = (shots / threshold * 100) if threshold > 0 else 0
+                    changed |= self._set_widget('progress', self.progress_bar, value=round(min(progress, 100)))
                 
                 # Update mode
-                self.mode_label.configure(text="Autotune" if autotune else "Manual")
+                changed |= self._set_widget('mode', self.mode_label, text="Autotune" if autotune else "Manual")
                 
-                # Update connection status
-                connected = self.tuner.nt_interface.is_connected()
-                if connected != self.connected:
-                    self.connected = connected
-                    if connected:
-                        self.connection_label.configure(text="Connected", foreground="green")
-                    else:
-                        self.connection_label.configure(text="Connecting...", foreground="orange")
+                # Update connection status from the listener, or poll until it reports
+                while self._connection_events:
+                    self._connection_listener_reported = True
+                    changed |= self._set_connection_state(self._connection_events.popleft())
+                now = time.monotonic()
+                if (not self._connection_listener_reported
+                        and now - self._last_connection_check >= CONNECTION_CHECK_INTERVAL_S):
+                    self._last_connection_check = now
+                    changed |= self._set_connection_state(tuner.nt_interface.is_connected())
             except Exception as e:
                 # Log the exception to avoid silent failures in the UI update loop
                 print(f"Exception in _update_ui: {e}", file=sys.stderr)
         
-        # Schedule next update
+        # Schedule next update, polling less often while nothing is happening
+        if changed:
+            self._ui_interval = POLL_MIN_MS
+        else:
+            self._ui_interval = min(self._ui_interval * 2, POLL_MAX_MS)
         if self.running:
-            self.root.after(200, self._update_ui)
+            self.root.after(self._ui_interval, self._update_ui)
+    
+    def _set_connection_state(self, connected):
+        """
+        Update the connection label when the connection state flips.
+        
+        Returns:
+            True if the state changed
+        """
+        if not self.running or connected == self.connected:
+            return False
+        self.connected = connected
+        if connected:
+            self.connection_label.configure(text="Connected", foreground="green")
+            self._log("  ✓ Connected to NetworkTables!", "success")
+        else:
+            self.connection_label.configure(text="Connecting...", foreground="orange")
+            self._log("  ⚠ NetworkTables connection lost, reconnecting...", "warning")
+        return True
     
     def _on_close(self):
         """Handle window close."""
-        if self.running:
+        if self.running and not self._stopping:
             if messagebox.askyesno("Confirm Exit", "Tuner is still running. Stop and exit?"):
                 self._stop_tuner()
                 self.root.destroy()
@@ -45,7 +45,9 @@ When autotune_enabled = True:
     ShotThreshold. The dashboard shows progress toward this threshold.
 """
 
+import sys
 import time
+from collections import deque
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import logging
@@ -76,6 +78,11 @@ try:
             if NetworkTables._inst is None:
                 return None
             return NetworkTables._inst.getTable(name)
+        
+        @staticmethod
+        def flush():
+            if NetworkTables._inst is not None:
+                NetworkTables._inst.flush()
     
 except ImportError:
     try:
@@ -95,12 +102,53 @@ except ImportError:
             @staticmethod
             def getTable(name):
                 return None
+            
+            @staticmethod
+            def flush():
+                pass
 
 
 logger = logging.getLogger(__name__)
 
+# Layout of the robot's /FiringSolver/ShotPacket number array: element 0 is
+# SHOT_PACKET_VERSION, followed by SHOT_PACKET_FIELDS in order. Must match the
+# array built in FiringSolver.logShot() on the Java side; bump the version
+# there and here together when the layout changes.
+SHOT_PACKET_VERSION = 1
+SHOT_PACKET_FIELDS = (
+    "ShotTimestamp",
+    "Hit",
+    "Distance",
+    "pitchRadians",
+    "exitVelocity",
+    "yawRadians",
+    "TargetHeight",
+    "LaunchHeight",
+    "DragCoefficient",
+    "AirDensity",
+    "ProjectileMass",
+    "ProjectileArea",
+)
+
+
+def _decode_shot_packet(packet) -> Optional[tuple]:
+    """
+    Unpack a ShotPacket array into values in SHOT_PACKET_FIELDS order.
+    
+    Returns None for an empty packet or an unknown layout version, so the
+    caller can fall back to the individual entries.
+    """
+    if len(packet) != len(SHOT_PACKET_FIELDS) + 1 or packet[0] != SHOT_PACKET_VERSION:
+        return None
+    values = tuple(packet[1:])
+    return values[:1] + (bool(values[1]),) + values[2:]
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ShotData:
     """Container for shot data from NetworkTables."""
     
@@ -156,13 +204,18 @@ class NetworkTablesInterface:
         """
         self.config = config
         self.connected = False
-        self.last_connection_attempt = 0.0
+        # Interval bookkeeping uses time.monotonic() so clock changes can't stall it
+        self.last_connection_attempt = float('-inf')
         self.shot_data_listeners = []
+        # Functions that unregister connection listeners, called by stop()
+        self._connection_listener_removers = []
+        # Functions that unregister shot listeners, called by stop()
+        self._shot_listener_removers = []
         
         # Rate limiting to prevent RoboRIO overload
-        self.last_write_time = 0.0
+        self.last_write_time = float('-inf')
         self.min_write_interval = 1.0 / config.MAX_NT_WRITE_RATE_HZ
-        self.last_read_time = 0.0
+        self.last_read_time = float('-inf')
         self.min_read_interval = 1.0 / config.MAX_NT_READ_RATE_HZ
         self.pending_writes = {}  # For batching writes if enabled
         
@@ -173,6 +226,13 @@ class NetworkTablesInterface:
         
         # Cache for frequently accessed subtables
         self._table_cache = {}
+        # Coefficient entries under /Tuning, keyed by nt_key
+        self._entry_cache = {}
+        
+        # pyntcore subscriber that queues every ShotPacket, so shots landing
+        # between rate-limited reads aren't lost
+        self._shot_packet_sub = None
+        self._queued_shot_packets = deque()
         
         # Last shot data
         self.last_shot_timestamp = 0.0
@@ -192,7 +252,7 @@ class NetworkTablesInterface:
         Returns:
             True if connected successfully, False otherwise
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Throttle connection attempts
         if current_time - self.last_connection_attempt < self.config.NT_RECONNECT_DELAY_SECONDS:
@@ -209,10 +269,10 @@ class NetworkTablesInterface:
             
             # Wait for connection
             timeout = self.config.NT_TIMEOUT_SECONDS
-            start_time = time.time()
+            start_time = time.monotonic()
             
             while not NetworkTables.isConnected():
-                if time.time() - start_time > timeout:
+                if time.monotonic() - start_time > timeout:
                     logger.warning(f"Connection timeout after {timeout}s")
                     return False
                 time.sleep(0.1)
@@ -221,6 +281,8 @@ class NetworkTablesInterface:
             self.root_table = NetworkTables.getTable("")
             self.tuning_table = NetworkTables.getTable("/Tuning")
             self.firing_solver_table = NetworkTables.getTable(self.config.NT_SHOT_DATA_TABLE)
+            self._entry_cache.clear()
+            self._subscribe_shot_packets()
             
             self.connected = True
             logger.info("Connected to NetworkTables successfully")
@@ -255,13 +317,76 @@ class NetworkTablesInterface:
         
         return self.connected
     
+    def add_connection_listener(self, callback) -> bool:
+        """
+        Call callback(connected) whenever the connection state changes.
+        
+        The callback is also called once with the current state, and runs on
+        the NetworkTables thread. Listeners are removed by stop() or
+        remove_connection_listeners().
+        
+        Args:
+            callback: Function taking a single bool
+            
+        Returns:
+            True if the listener was registered, False if the NetworkTables
+            library has no connection listener support (keep polling then)
+        """
+        try:
+            if hasattr(NetworkTables, '_inst'):
+                # pyntcore wrapper
+                inst = NetworkTables._inst
+                if inst is None:
+                    return False
+                
+                def on_event(event):
+                    callback(bool(event.flags & ntcore.EventFlags.kConnected))
+                
+                handle = inst.addConnectionListener(True, on_event)
+                self._connection_listener_removers.append(lambda: inst.removeListener(handle))
+            elif hasattr(NetworkTables, 'addConnectionListener'):
+                # pynetworktables
+                def on_change(connected, _info):
+                    callback(bool(connected))
+                
+                NetworkTables.addConnectionListener(on_change, immediateNotify=True)
+                self._connection_listener_removers.append(
+                    lambda: NetworkTables.removeConnectionListener(on_change)
+                )
+            else:
+                return False
+        except Exception as e:
+            logger.warning(f"Could not register connection listener, falling back to polling: {e}")
+            return False
+        
+        return True
+    
+    def remove_connection_listeners(self):
+        """Unregister every callback added with add_connection_listener()."""
+        removers, self._connection_listener_removers = self._connection_listener_removers, []
+        for remove_listener in removers:
+            try:
+                remove_listener()
+            except Exception as e:
+                logger.warning(f"Could not remove connection listener: {e}")
+    
     def stop(self):
         """Stop NetworkTables connection."""
         try:
             # NetworkTables doesn't have an explicit stop in pynetworktables
             self.connected = False
+            self.remove_connection_listeners()
+            for remove_listener in self._shot_listener_removers:
+                remove_listener()
+            self._shot_listener_removers.clear()
+            self.shot_data_listeners.clear()
             # Clear cached tables on disconnect
             self._table_cache.clear()
+            self._entry_cache.clear()
+            if self._shot_packet_sub is not None:
+                self._shot_packet_sub.close()
+                self._shot_packet_sub = None
+            self._queued_shot_packets.clear()
             logger.info("Stopped NetworkTables connection")
         except Exception as e:
             logger.error(f"Error during stop: {e}")
@@ -284,9 +409,28 @@ class NetworkTablesInterface:
         Returns:
             NetworkTables table object
         """
-        if table_path not in self._table_cache:
-            self._table_cache[table_path] = NetworkTables.getTable(table_path)
-        return self._table_cache[table_path]
+        table = self._table_cache.get(table_path)
+        if table is None:
+            table = NetworkTables.getTable(table_path)
+            # Not cached while disconnected (pyntcore returns None before initialize)
+            if table is not None:
+                self._table_cache[table_path] = table
+        return table
+    
+    def _entry(self, nt_key: str):
+        """
+        Get the /Tuning entry for a coefficient, caching the handle.
+        
+        Args:
+            nt_key: NetworkTables key path relative to /Tuning
+            
+        Returns:
+            NetworkTables entry object
+        """
+        entry = self._entry_cache.get(nt_key)
+        if entry is None:
+            entry = self._entry_cache[nt_key] = self.tuning_table.getEntry(nt_key)
+        return entry
     
     def read_coefficient(self, nt_key: str, default_value: float) -> float:
         """
@@ -304,7 +448,7 @@ class NetworkTablesInterface:
             return default_value
         
         try:
-            value = self.tuning_table.getNumber(nt_key, default_value)
+            value = self._entry(nt_key).getDouble(default_value)
             return value
         except Exception as e:
             logger.error(f"Error reading {nt_key}: {e}")
@@ -316,10 +460,13 @@ class NetworkTablesInterface:
         
         Protects RoboRIO from being overloaded with too frequent updates.
         
+        Writes that would not change the value are skipped (and count as
+        success) unless forced.
+        
         Args:
             nt_key: NetworkTables key path
             value: Coefficient value to write
-            force: If True, bypass rate limiting (use sparingly)
+            force: If True, bypass rate limiting and always write (use sparingly)
         
         Returns:
             True if write succeeded, False otherwise
@@ -328,8 +475,12 @@ class NetworkTablesInterface:
             logger.warning(f"Not connected, cannot write {nt_key}")
             return False
         
+        if not force and self._is_current_value(nt_key, value):
+            logger.debug(f"Skipping write for {nt_key}, already {value}")
+            return True
+        
         # Rate limiting check (unless forced)
-        current_time = time.time()
+        current_time = time.monotonic()
         if not force:
             time_since_last_write = current_time - self.last_write_time
             if time_since_last_write < self.min_write_interval:
@@ -342,14 +493,44 @@ class NetworkTablesInterface:
                     logger.debug(f"Skipping write for {nt_key} due to rate limit")
                     return False
         
+        if not self._set_coefficient(nt_key, value):
+            return False
+        logger.info(f"Wrote {nt_key} = {value}")
+        return True
+    
+    def _is_current_value(self, nt_key: str, value: float) -> bool:
+        """
+        Check whether a coefficient entry already holds value.
+        
+        Compares against the entry's local NetworkTables value rather than
+        the last value written here, so changes made from the dashboard or
+        robot are still overwritten.
+        """
+        return self._entry(nt_key).getDouble(float('nan')) == value
+    
+    def _set_coefficient(self, nt_key: str, value: float) -> bool:
+        """
+        Set a coefficient entry, bypassing rate limiting and per-write logging.
+        
+        Callers are responsible for the connection and rate limit checks.
+        
+        Returns:
+            True if write succeeded, False otherwise
+        """
         try:
-            self.tuning_table.putNumber(nt_key, value)
-            self.last_write_time = current_time
-            logger.info(f"Wrote {nt_key} = {value}")
-            return True
+            self._entry(nt_key).setDouble(value)
         except Exception as e:
             logger.error(f"Error writing {nt_key}: {e}")
             return False
+        self.last_write_time = time.monotonic()
+        return True
+    
+    def _flush(self):
+        """Send queued NetworkTables updates to the robot now instead of on the next periodic flush."""
+        try:
+            NetworkTables.flush()
+        except Exception as e:
+            logger.debug(f"NetworkTables flush failed: {e}")
     
     def flush_pending_writes(self) -> int:
         """
@@ -361,17 +542,128 @@ class NetworkTablesInterface:
         if not self.pending_writes:
             return 0
         
-        count = 0
+        if not self.is_connected():
+            return 0
+        
+        written = []
         for nt_key, value in list(self.pending_writes.items()):
-            if self.write_coefficient(nt_key, value, force=True):
-                count += 1
+            if self._set_coefficient(nt_key, value):
+                written.append(f"{nt_key}={value}")
                 del self.pending_writes[nt_key]
         
+        count = len(written)
         if count > 0:
-            logger.info(f"Flushed {count} batched writes to NetworkTables")
+            self._flush()
+            logger.info(f"Flushed {count} batched writes to NetworkTables: {', '.join(written)}")
         
         return count
     
+    def add_shot_listener(self, callback) -> bool:
+        """
+        Call callback() whenever the robot publishes a new ShotTimestamp.
+        
+        The callback runs on the NetworkTables thread, so it should only do
+        something cheap such as setting a threading.Event. Shot data itself
+        is still read with read_shot_data().
+        
+        Args:
+            callback: Function taking no arguments
+            
+        Returns:
+            True if the listener was registered, False if not connected or the
+            NetworkTables library has no listener support (keep polling then)
+        """
+        table = self.firing_solver_table
+        if table is None:
+            return False
+        
+        def on_change(*_args):
+            callback()
+        
+        try:
+            if hasattr(table, 'addListener'):
+                # pyntcore
+                handle = table.addListener("ShotTimestamp", ntcore.EventFlags.kValueAll, on_change)
+                self._shot_listener_removers.append(lambda: table.removeListener(handle))
+            elif hasattr(table, 'addEntryListener'):
+                # pynetworktables
+                table.addEntryListener(on_change, key="ShotTimestamp")
+                self._shot_listener_removers.append(lambda: table.removeEntryListener(on_change))
+            else:
+                return False
+        except Exception as e:
+            logger.warning(f"Could not register shot listener, falling back to polling: {e}")
+            return False
+        
+        self.shot_data_listeners.append(callback)
+        return True
+    
+    def _subscribe_shot_packets(self):
+        """Queue ShotPacket updates with a pyntcore subscriber, if available."""
+        table = self.firing_solver_table
+        if self._shot_packet_sub is not None or not hasattr(table, 'getDoubleArrayTopic'):
+            return
+        
+        try:
+            # sendAll keeps NT4 from coalescing back-to-back packets; the robot's
+            # publisher sets it too
+            self._shot_packet_sub = table.getDoubleArrayTopic("ShotPacket").subscribe(
+                [], ntcore.PubSubOptions(pollStorage=32, sendAll=True)
+            )
+        except Exception as e:
+            logger.warning(f"Could not subscribe to ShotPacket, reading latest value only: {e}")
+    
+    def _read_shot_values(self) -> Optional[tuple]:
+        """
+        Read the latest shot's values in SHOT_PACKET_FIELDS order.
+        
+        Uses the robot's batched ShotPacket array when it is published, so
+        every field comes from the same shot in a single read. With pyntcore,
+        packets are queued by a subscriber and returned one per call, oldest
+        first. Falls back to the individual entries for robot code that does
+        not publish it or publishes a different layout version.
+        
+        Returns:
+            Tuple of values, or None if there is no new shot
+        """
+        table = self.firing_solver_table
+        
+        if self._shot_packet_sub is not None:
+            # One readQueue() call returns every packet published since the last poll
+            queue = self._queued_shot_packets
+            queue.extend(update.value for update in self._shot_packet_sub.readQueue())
+            while queue:
+                values = _decode_shot_packet(queue.popleft())
+                if values is not None and values[0] > self.last_shot_timestamp:
+                    return values
+        else:
+            values = _decode_shot_packet(table.getNumberArray("ShotPacket", ()))
+            if values is not None:
+                return values if values[0] > self.last_shot_timestamp else None
+        
+        # Check if there's new shot data by monitoring timestamp
+        shot_timestamp = table.getNumber("ShotTimestamp", 0.0)
+        
+        # Only process if this is a new shot
+        if shot_timestamp <= self.last_shot_timestamp:
+            return None
+        
+        solution_table = table.getSubTable("Solution")
+        return (
+            shot_timestamp,
+            table.getBoolean("Hit", False),
+            table.getNumber("Distance", 0.0),
+            solution_table.getNumber("pitchRadians", 0.0),
+            solution_table.getNumber("exitVelocity", 0.0),
+            solution_table.getNumber("yawRadians", 0.0),
+            table.getNumber("TargetHeight", 0.0),
+            table.getNumber("LaunchHeight", 0.0),
+            table.getNumber("DragCoefficient", 0.0),
+            table.getNumber("AirDensity", 1.225),
+            table.getNumber("ProjectileMass", 0.0),
+            table.getNumber("ProjectileArea", 0.0),
+        )
+    
     def read_shot_data(self) -> Optional[ShotData]:
         """
         Read the latest shot data from NetworkTables with rate limiting.
@@ -390,7 +682,7 @@ class NetworkTablesInterface:
             return None
         
         # Rate limiting check
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last_read = current_time - self.last_read_time
         if time_since_last_read < self.min_read_interval:
             return None  # Skip read to avoid overloading RoboRIO
@@ -398,34 +690,13 @@ class NetworkTablesInterface:
         self.last_read_time = current_time
         
         try:
-            # Check if there's new shot data by monitoring timestamp
-            shot_timestamp = self.firing_solver_table.getNumber("ShotTimestamp", 0.0)
-            
-            # Only process if this is a new shot
-            if shot_timestamp <= self.last_shot_timestamp:
+            values = self._read_shot_values()
+            if values is None:
                 return None
             
-            # Read shot result (hit or miss)
-            hit = self.firing_solver_table.getBoolean("Hit", False)
-            
-            # Read calculated firing solution data
-            distance = self.firing_solver_table.getNumber("Distance", 0.0)
-            
-            # Read from solution subtable
-            solution_table = self.firing_solver_table.getSubTable("Solution")
-            angle = solution_table.getNumber("pitchRadians", 0.0)
-            velocity = solution_table.getNumber("exitVelocity", 0.0)
-            yaw = solution_table.getNumber("yawRadians", 0.0)
-            
-            # Read physical parameters used in calculation
-            target_height = self.firing_solver_table.getNumber("TargetHeight", 0.0)
-            launch_height = self.firing_solver_table.getNumber("LaunchHeight", 0.0)
-            
-            # Read current coefficient values AT TIME OF SHOT
-            drag_coeff = self.firing_solver_table.getNumber("DragCoefficient", 0.0)
-            air_density = self.firing_solver_table.getNumber("AirDensity", 1.225)
-            projectile_mass = self.firing_solver_table.getNumber("ProjectileMass", 0.0)
-            projectile_area = self.firing_solver_table.getNumber("ProjectileArea", 0.0)
+            (shot_timestamp, hit, distance, angle, velocity, yaw,
+             target_height, launch_height, drag_coeff, air_density,
+             projectile_mass, projectile_area) = values
             
             # Create comprehensive shot data object
             shot_data = ShotData(
@@ -469,7 +740,7 @@ class NetworkTablesInterface:
         
         try:
             # Check FMSInfo for FMS control data
-            fms_table = NetworkTables.getTable("/FMSInfo")
+            fms_table = self._get_cached_table("/FMSInfo")
             
             # If FMSControlData exists and is not 0, we're in a match
             fms_control = fms_table.getNumber("FMSControlData", 0)
@@ -515,20 +786,52 @@ class NetworkTablesInterface:
         """
         Write multiple coefficient values to NetworkTables.
         
+        The batch counts as one write for rate limiting, and is flushed
+        to the robot once after all values are set.
+        
         Args:
             coefficient_values: Dict mapping coefficient names to values
         
         Returns:
             True if all writes succeeded, False otherwise
         """
-        success = True
+        coefficients = self.config.COEFFICIENTS
+        writes = []
         for name, value in coefficient_values.items():
-            if name in self.config.COEFFICIENTS:
-                coeff = self.config.COEFFICIENTS[name]
-                if not self.write_coefficient(coeff.nt_key, value):
-                    success = False
+            coeff = coefficients.get(name)
+            if coeff is not None:
+                writes.append((coeff.nt_key, value))
+        if not writes:
+            return True
+        
+        if not self.is_connected():
+            logger.warning("Not connected, cannot write coefficients")
+            return False
+        
+        # Leave out values the robot already has
+        writes = [(nt_key, value) for nt_key, value in writes if not self._is_current_value(nt_key, value)]
+        if not writes:
+            return True
+        
+        # Rate limit the batch as a single write
+        if time.monotonic() - self.last_write_time < self.min_write_interval:
+            if self.config.NT_BATCH_WRITES:
+                self.pending_writes.update(writes)
+                logger.debug(f"Queueing {len(writes)} writes due to rate limit")
+            else:
+                logger.debug(f"Skipping {len(writes)} writes due to rate limit")
+            return False
+        
+        written = [
+            f"{nt_key}={value}"
+            for nt_key, value in writes
+            if self._set_coefficient(nt_key, value)
+        ]
         
-        return success
+        self._flush()
+        # One summary line per batch rather than one per coefficient
+        logger.info(f"Wrote {len(written)} coefficients: {', '.join(written)}")
+        return len(written) == len(writes)
     
     def write_interlock_settings(self, require_shot_logged: bool, require_coefficients_updated: bool):
         """
@@ -542,7 +845,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            interlock_table = NetworkTables.getTable("/FiringSolver/Interlock")
+            interlock_table = self._get_cached_table("/FiringSolver/Interlock")
             interlock_table.putBoolean("RequireShotLogged", require_shot_logged)
             interlock_table.putBoolean("RequireCoefficientsUpdated", require_coefficients_updated)
             
@@ -561,7 +864,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            interlock_table = NetworkTables.getTable("/FiringSolver/Interlock")
+            interlock_table = self._get_cached_table("/FiringSolver/Interlock")
             interlock_table.putBoolean("CoefficientsUpdated", True)
             logger.debug("Signaled coefficients updated")
         except Exception as e:
@@ -579,7 +882,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            interlock_table = NetworkTables.getTable("/FiringSolver/Interlock")
+            interlock_table = self._get_cached_table("/FiringSolver/Interlock")
             interlock_table.putBoolean("ShotLogged", True)
             logger.debug("Signaled shot logged")
         except Exception as e:
@@ -609,10 +912,7 @@ class NetworkTablesInterface:
             return False
         
         try:
-            # Use cached table lookup to avoid repeated getTable() calls
-            if '/Tuning/BayesianTuner' not in self._table_cache:
-                self._table_cache['/Tuning/BayesianTuner'] = NetworkTables.getTable("/Tuning/BayesianTuner")
-            tuner_table = self._table_cache['/Tuning/BayesianTuner']
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             
             button_pressed = tuner_table.getBoolean("RunOptimization", False)
             
@@ -656,7 +956,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             tuner_table.putBoolean("AutotuneEnabled", autotune_enabled)
             tuner_table.putNumber("ShotCount", shot_count)
             tuner_table.putNumber("ShotThreshold", shot_threshold)
@@ -712,7 +1012,7 @@ class NetworkTablesInterface:
             return False
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             button_pressed = tuner_table.getBoolean("SkipToNextCoefficient", False)
             
             if button_pressed:
@@ -746,7 +1046,7 @@ class NetworkTablesInterface:
             return -1
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             update_pressed = tuner_table.getBoolean("UpdateGlobalThreshold", False)
             
             if update_pressed:
@@ -782,7 +1082,7 @@ class NetworkTablesInterface:
             return -1
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             update_pressed = tuner_table.getBoolean("UpdateLocalThreshold", False)
             
             if update_pressed:
@@ -818,7 +1118,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             tuner_table.putString("CurrentCoefficient", coeff_name)
             tuner_table.putBoolean("CurrentCoeffAutotune", is_autotune)
             tuner_table.putNumber("CurrentCoeffThreshold", shot_threshold)
@@ -866,7 +1166,7 @@ class NetworkTablesInterface:
             return (False, True)  # Default to enabled if not connected
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             
             # Read the current toggle value from dashboard
             current_value = tuner_table.getBoolean("TunerEnabled", True)
@@ -912,7 +1212,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             
             # Initialize TunerEnabled toggle on first write (only if it doesn't exist)
             # This preserves user changes made on the dashboard
@@ -936,13 +1236,15 @@ class NetworkTablesInterface:
     
     def publish_heartbeat(self):
         """
-        Publish a heartbeat timestamp to NetworkTables.
+        Publish a heartbeat value to NetworkTables.
         
         This allows the Java TunerInterface to detect if the Python tuner
-        is connected and running by checking if the timestamp is recent.
+        is connected and running by checking that the value keeps changing.
         
-        The Java side checks if (currentTime - heartbeat) < 5.0 seconds.
-        This method should be called periodically (e.g., every 1-2 seconds).
+        The value is this process's time.monotonic() in seconds. It is an
+        opaque token, not comparable with the robot clock: the Java side
+        reports connected while the value has changed within the last 5.0
+        seconds. This method should be called periodically (e.g., every 1-2 seconds).
         
         The method includes internal rate limiting - it will only publish
         if at least 0.5 seconds have passed since the last heartbeat to
@@ -953,18 +1255,18 @@ class NetworkTablesInterface:
         if not self.is_connected():
             return
         
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Rate limiting: only publish if >0.5s since last heartbeat
         if not hasattr(self, '_last_heartbeat_time'):
-            self._last_heartbeat_time = 0.0
+            self._last_heartbeat_time = float('-inf')
         
         time_since_last = current_time - self._last_heartbeat_time
         if time_since_last < 0.5:
             return  # Too soon, skip this heartbeat
         
         try:
-            tuner_table = NetworkTables.getTable("/Tuning/BayesianTuner")
+            tuner_table = self._get_cached_table("/Tuning/BayesianTuner")
             tuner_table.putNumber("Heartbeat", current_time)
             self._last_heartbeat_time = current_time
             logger.debug(f"Published heartbeat: {current_time}")
@@ -995,7 +1297,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            manual_table = NetworkTables.getTable("/Tuning/BayesianTuner/ManualControl")
+            manual_table = self._get_cached_table("/Tuning/BayesianTuner/ManualControl")
             
             # Initialize controls if they don't exist
             if not manual_table.containsKey("ManualAdjustEnabled"):
@@ -1041,7 +1343,7 @@ class NetworkTablesInterface:
             return (False, "", 0.0)
         
         try:
-            manual_table = NetworkTables.getTable("/Tuning/BayesianTuner/ManualControl")
+            manual_table = self._get_cached_table("/Tuning/BayesianTuner/ManualControl")
             
             # Check if adjustment is enabled
             if not manual_table.getBoolean("ManualAdjustEnabled", False):
@@ -1083,7 +1385,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            manual_table = NetworkTables.getTable("/Tuning/BayesianTuner/ManualControl")
+            manual_table = self._get_cached_table("/Tuning/BayesianTuner/ManualControl")
             manual_table.putNumber("CurrentValue", current_value)
             manual_table.putNumber("MinValue", min_val)
             manual_table.putNumber("MaxValue", max_val)
@@ -1109,7 +1411,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            fine_table = NetworkTables.getTable("/Tuning/BayesianTuner/FineTuning")
+            fine_table = self._get_cached_table("/Tuning/BayesianTuner/FineTuning")
             
             if not fine_table.containsKey("FineTuningEnabled"):
                 fine_table.putBoolean("FineTuningEnabled", False)
@@ -1141,7 +1443,7 @@ class NetworkTablesInterface:
             return (False, "CENTER", 0.0)
         
         try:
-            fine_table = NetworkTables.getTable("/Tuning/BayesianTuner/FineTuning")
+            fine_table = self._get_cached_table("/Tuning/BayesianTuner/FineTuning")
             enabled = fine_table.getBoolean("FineTuningEnabled", False)
             target_bias = fine_table.getString("TargetBias", "CENTER")
             bias_amount = fine_table.getNumber("BiasAmount", 0.0)
@@ -1173,7 +1475,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            backtrack_table = NetworkTables.getTable("/Tuning/BayesianTuner/Backtrack")
+            backtrack_table = self._get_cached_table("/Tuning/BayesianTuner/Backtrack")
             
             if not backtrack_table.containsKey("BacktrackEnabled"):
                 backtrack_table.putBoolean("BacktrackEnabled", False)
@@ -1204,7 +1506,7 @@ class NetworkTablesInterface:
             return (False, "")
         
         try:
-            backtrack_table = NetworkTables.getTable("/Tuning/BayesianTuner/Backtrack")
+            backtrack_table = self._get_cached_table("/Tuning/BayesianTuner/Backtrack")
             
             # Check if backtracking is enabled
             if not backtrack_table.getBoolean("BacktrackEnabled", False):
@@ -1241,7 +1543,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            backtrack_table = NetworkTables.getTable("/Tuning/BayesianTuner/Backtrack")
+            backtrack_table = self._get_cached_table("/Tuning/BayesianTuner/Backtrack")
             backtrack_table.putString("TunedCoefficients", ",".join(tuned_coefficients))
             backtrack_table.putString("CurrentCoefficient", current_coefficient)
         except Exception as e:
@@ -1269,7 +1571,7 @@ class NetworkTablesInterface:
             return
         
         try:
-            live_table = NetworkTables.getTable("/Tuning/BayesianTuner/CoefficientsLive")
+            live_table = self._get_cached_table("/Tuning/BayesianTuner/CoefficientsLive")
             
             for name, current_val in coefficient_values.items():
                 if name in coefficients:
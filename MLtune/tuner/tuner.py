@@ -80,6 +80,11 @@ class BayesianTunerCoordinator:
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.last_shot_timestamp = 0.0
+        # Set to wake the tuning loop early (new shot from the robot, or stop())
+        self._wake_event = threading.Event()
+        # Heartbeat runs on its own thread so long optimizations can't delay it
+        self.heartbeat_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         
         # ── Runtime Enable/Disable Toggle ──
         # This can be changed at runtime via dashboard
@@ -167,11 +172,20 @@ class BayesianTunerCoordinator:
             event="SESSION_START"
         )
         
+        # Wake the loop as soon as a shot arrives instead of waiting out the update period
+        if self.nt_interface.add_shot_listener(self._wake_event.set):
+            logger.info("Listening for shot data events")
+        
         # Start tuning thread
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._tuning_loop, daemon=True)
         self.thread.start()
         
+        # Start heartbeat thread
+        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+        self.heartbeat_thread.start()
+        
         logger.info("Tuner started successfully")
     
     def stop(self):
@@ -184,6 +198,8 @@ class BayesianTunerCoordinator:
         self.data_logger.log_event('STOP', 'Tuner stopping')
         
         self.running = False
+        self._wake_event.set()
+        self._stop_event.set()
         
         # Wait for thread to finish
         if self.thread:
@@ -191,6 +207,9 @@ class BayesianTunerCoordinator:
             if self.thread.is_alive():
                 logger.warning("Tuner thread did not stop gracefully")
         
+        if self.heartbeat_thread:
+            self.heartbeat_thread.join(timeout=self.config.GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS)
+        
         # Stop NetworkTables connection
         self.nt_interface.stop()
         
@@ -231,7 +250,9 @@ class BayesianTunerCoordinator:
                 # Allows going back to previously tuned coefficients
                 self._check_backtrack_request()
                 
-                # Check for new shot data
+                # Check for new shot data. Clear the wake flag first so a shot that
+                # arrives after this read still wakes the wait below.
+                self._wake_event.clear()
                 shot_data = self.nt_interface.read_shot_data()
                 
                 if shot_data:
@@ -259,8 +280,8 @@ class BayesianTunerCoordinator:
                 # Update status on dashboard
                 self._update_status()
                 
-                # Sleep until next update
-                time.sleep(update_period)
+                # Sleep until next update, or until the shot listener wakes us
+                self._wake_event.wait(update_period)
                 
             except Exception as e:
                 logger.error(f"Error in tuning loop: {e}", exc_info=True)
@@ -269,6 +290,13 @@ class BayesianTunerCoordinator:
         
         logger.info("Tuning loop ended")
     
+    def _heartbeat_loop(self):
+        """Publish the heartbeat at a fixed rate, independent of the tuning loop."""
+        interval = self.config.HEARTBEAT_INTERVAL_SECONDS
+        while not self._stop_event.is_set():
+            self.nt_interface.publish_heartbeat()
+            self._stop_event.wait(interval)
+    
     def _check_runtime_toggle(self):
         """
         Check for runtime enable/disable toggle changes from the dashboard.
@@ -589,14 +617,12 @@ class BayesianTunerCoordinator:
         
         coeff = self.config.COEFFICIENTS[coeff_name]
         # Get the current effective threshold for proper logging
-        _, old_threshold = coeff.get_effective_autotune_settings(
-            self.config.AUTOTUNE_ENABLED, 
+        old_threshold = coeff.get_effective_autotune_threshold(
             self.config.AUTOTUNE_SHOT_THRESHOLD
         )
         
         # Enable override so local setting takes precedence
-        coeff.autotune_override = True
-        coeff.autotune_shot_threshold = new_threshold
+        coeff.set_local_autotune_threshold(new_threshold)
         
         logger.info(f"Updating LOCAL shot threshold for {coeff_name}: {old_threshold} -> {new_threshold}")
         self.data_logger.log_event('LOCAL_THRESHOLD_UPDATE', f'{coeff_name} threshold: {old_threshold} -> {new_threshold}')
@@ -918,15 +944,18 @@ def run_tuner(server_ip: Optional[str] = None, config: Optional[TunerConfig] = N
         config: Optional TunerConfig object
     """
     # Setup logging
-    if config:
-        setup_logging(config)
-    else:
-        setup_logging(TunerConfig())
+    config = config or TunerConfig()
+    setup_logging(config)
     
     logger.info("="*60)
     logger.info("FRC Shooter Bayesian Tuner")
     logger.info("="*60)
     
+    # A disabled tuner never starts, so don't load coefficients or build the coordinator
+    if not config.TUNER_ENABLED:
+        logger.info("Tuner is disabled (TUNER_ENABLED = False)")
+        return
+    
     # Create and run tuner
     with BayesianTunerCoordinator(config) as tuner:
         # Flag to track if the user wants to stop
@@ -32,16 +32,35 @@ This dashboard provides complete control over the tuning system with:
 """
 
 import dash
-from dash import dcc, html, Input, Output, State, callback_context, ALL, MATCH, no_update
+from dash import dcc, html, Input, Output, State, callback_context, ALL, MATCH, no_update, Patch, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
 import plotly.express as px
+import plotly.io as pio
 from datetime import datetime
+import importlib.util
+import atexit
 import json
+import logging
+import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Callbacks only enqueue log records; a background listener does the stdout I/O.
+# Set up at import so records are shown under any entry point (python -m
+# dashboard, a WSGI server, ...), and flushed at exit.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Add parent directory to path for tuner imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "MLtune" / "tuner"))
 
@@ -53,11 +72,31 @@ except ImportError:
     TUNER_AVAILABLE = False
     print("Warning: Tuner modules not available. Dashboard will run in demo mode.")
 
+# Gzip callback responses when flask-compress is installed (optional dependency)
+COMPRESS_AVAILABLE = importlib.util.find_spec('flask_compress') is not None
+
+# Dash serializes callback responses through plotly's JSON encoder; use orjson
+# for it when installed (optional dependency), falling back to stdlib json
+ORJSON_AVAILABLE = importlib.util.find_spec('orjson') is not None
+if ORJSON_AVAILABLE:
+    pio.json.config.default_engine = 'orjson'
+
+# Printed when the dashboard is started from the command line
+STARTUP_BANNER = "\n".join((
+    "=" * 60,
+    "MLtune Dashboard Starting",
+    "=" * 60,
+    "Opening browser to: http://localhost:8050",
+    "=" * 60,
+    f"Tuner integration: {'Available' if TUNER_AVAILABLE else 'Demo mode'}",
+))
+
 # Initialize Dash app with Bootstrap theme
 app = dash.Dash(
     __name__,
     external_stylesheets=[dbc.themes.BOOTSTRAP, '/assets/css/custom.css'],
     suppress_callback_exceptions=True,
+    compress=COMPRESS_AVAILABLE,
     title="MLtune Dashboard"
 )
 
@@ -91,8 +130,6 @@ app_state = {
     'tuner_enabled': False,
     'current_coefficient': 'kDragCoefficient',
     'coefficient_values': {},
-    'notes': [],
-    'todos': [],
     'selected_algorithm': 'gp',
     'graphs_visible': {
         'success_rate': True,
@@ -101,11 +138,20 @@ app_state = {
         'shot_distribution': False
     },
     'banner_dismissed': False,
-    'config_locked': False,
-    'shot_count': 0,
-    'success_rate': 0.0,
+    'config_locked': False
+}
+
+# Data that grows or changes independently of app_state lives in its own store,
+# so callbacks that only need app_state don't ship it back and forth
+notes_state = []
+todos_state = []
+robot_status_state = {
     'connection_status': 'disconnected'
 }
+stats_state = {
+    'shot_count': 0,
+    'success_rate': 0.0
+}
 
 # Coefficient defaults and configuration (module-level constants for reusability)
 COEFFICIENT_DEFAULTS = {
@@ -132,6 +178,59 @@ COEFFICIENT_CONFIG = {
 COEFFICIENT_NAMES = list(COEFFICIENT_DEFAULTS.keys())
 
 
+def _display_format_for_step(step):
+    """Pick a display format string for a coefficient based on its slider step."""
+    # If step is very small, show more decimal places
+    if step < 0.01:
+        return "{:.4f}"
+    elif step < 1:
+        return "{:.2f}"
+    else:
+        return "{:.0f}"
+
+
+# Display format per coefficient, computed once since COEFFICIENT_CONFIG is static
+COEFFICIENT_DISPLAY_FORMATS = {
+    name: _display_format_for_step(config.get('step', 0.1))
+    for name, config in COEFFICIENT_CONFIG.items()
+}
+
+
+# Empty-state placeholders, built once and shared so callbacks don't re-create them.
+# The notes/to-do placeholders are built per view instead (see create_notes_view),
+# since their visibility depends on what's in the stores.
+EMPTY_STATE_STYLE = {'fontStyle': 'italic', 'color': 'var(--text-secondary)'}
+EMPTY_PINNED_VALUES = [html.P("No pinned values yet. Click 📌 on any coefficient to pin it.", style=EMPTY_STATE_STYLE)]
+
+# Style dicts returned by callbacks, shared rather than rebuilt on every call
+VISIBLE_STYLE = {'display': 'block'}
+HIDDEN_STYLE = {'display': 'none'}
+# Using inline style since we can't access CSS variables in style dict
+PINNED_BUTTON_STYLE = {
+    'backgroundColor': '#ff6b35',  # Orange accent color
+    'borderColor': '#ff6b35',
+    'color': 'white',
+    'fontWeight': 'bold'
+}
+UNPINNED_BUTTON_STYLE = {}
+COEFF_CARD_STYLE = {'marginBottom': '12px'}
+COEFF_CARD_ACTIVE_STYLE = {'marginBottom': '12px', 'backgroundColor': 'var(--accent-subtle)'}
+COEFF_CARD_INACTIVE_STYLE = {'marginBottom': '12px', 'backgroundColor': 'var(--bg-primary)'}
+
+# Pinned value card styles
+PINNED_CARD_STYLE = {'marginBottom': '8px', 'padding': '12px'}
+PINNED_CARD_ROW_STYLE = {'display': 'flex', 'justifyContent': 'space-between', 'alignItems': 'center'}
+PINNED_CARD_ICON_STYLE = {'fontSize': '16px'}
+PINNED_CARD_NAME_STYLE = {'fontWeight': 'bold', 'marginRight': '8px'}
+PINNED_CARD_VALUE_STYLE = {'color': 'var(--accent-primary)', 'fontWeight': 'bold'}
+PINNED_CARD_ACTIONS_STYLE = {'display': 'flex', 'gap': '8px', 'alignItems': 'center'}
+PINNED_CARD_TIME_STYLE = {'fontSize': '11px', 'color': 'var(--text-secondary)', 'marginRight': '8px'}
+PINNED_CARD_UNPIN_STYLE = {'padding': '2px 8px', 'fontSize': '12px'}
+
+# Checklist value for new to-do cards (a tuple so the shared constant can't be mutated)
+TODO_NOT_DONE_VALUE = ()
+
+
 def clamp_coefficient_value(value, coeff_name):
     """
     Clamp a coefficient value to its configured min/max bounds.
@@ -249,11 +348,11 @@ def create_dashboard_view():
                         ]),
                         html.Div([
                             html.Label("Shot Count", style={'fontSize': '12px', 'color': 'var(--text-secondary)', 'fontWeight': '600', 'textTransform': 'uppercase'}),
-                            html.P(f"{app_state['shot_count']}", id='shot-display', style={'fontSize': '16px', 'fontWeight': '600', 'margin': '2px 0'}),
+                            html.P(f"{stats_state['shot_count']}", id='shot-display', style={'fontSize': '16px', 'fontWeight': '600', 'margin': '2px 0'}),
                         ]),
                         html.Div([
                             html.Label("Success Rate", style={'fontSize': '12px', 'color': 'var(--text-secondary)', 'fontWeight': '600', 'textTransform': 'uppercase'}),
-                            html.P(f"{app_state['success_rate']:.1%}", id='success-display', style={'fontSize': '16px', 'fontWeight': '600', 'margin': '2px 0', 'color': 'var(--success)'}),
+                            html.P(f"{stats_state['success_rate']:.1%}", id='success-display', style={'fontSize': '16px', 'fontWeight': '600', 'margin': '2px 0', 'color': 'var(--success)'}),
                         ]),
                     ])
                 ]),
@@ -348,7 +447,9 @@ def create_coefficients_view():
                         params['default']: {'label': str(params['default']), 'style': {'color': 'var(--accent-primary)'}},
                         params['max']: str(params['max'])
                     },
-                    tooltip={'placement': 'bottom', 'always_visible': True}
+                    tooltip={'placement': 'bottom', 'always_visible': True},
+                    # Fire slider callbacks once per drag gesture; the tooltip shows live values
+                    updatemode='mouseup'
                 ),
                 
                 # Fine adjustment buttons
@@ -388,9 +489,7 @@ def create_coefficients_view():
         html.Div(className="card", children=[
             html.Div("📌 Pinned Values", className="card-header"),
             html.P("Save and quickly restore coefficient sets", style={'color': 'var(--text-secondary)'}),
-            html.Div(id='pinned-values-list', children=[
-                html.P("No pinned values yet. Click 📌 on any coefficient to pin it.", style={'fontStyle': 'italic', 'color': 'var(--text-secondary)'})
-            ])
+            html.Div(id='pinned-values-list', children=EMPTY_PINNED_VALUES)
         ]),
         
         # Coefficient history
@@ -1319,7 +1418,12 @@ def create_robot_status_view():
 
 
 def create_notes_view():
-    """Create the notes and to-do view."""
+    """
+    Create the notes and to-do view.
+    
+    The empty-state placeholders are fresh on every mount and start visible;
+    the restore callbacks hide them when the stores already hold items.
+    """
     return html.Div([
         html.Div(className="card", children=[
             html.Div("Add Note", className="card-header"),
@@ -1335,16 +1439,14 @@ def create_notes_view():
         
         html.Div(className="card", children=[
             html.Div("Recent Notes", className="card-header"),
-            html.Div(id='notes-list', children=[
-                html.P("No notes yet", style={'fontStyle': 'italic', 'color': 'var(--text-secondary)'})
-            ])
+            html.P("No notes yet", id='notes-empty', style=EMPTY_STATE_STYLE),
+            html.Div(id='notes-list', children=[])
         ]),
         
         html.Div(className="card", children=[
             html.Div("To-Do List", className="card-header"),
-            html.Div(id='todos-list', children=[
-                html.P("No to-dos yet", style={'fontStyle': 'italic', 'color': 'var(--text-secondary)'})
-            ])
+            html.P("No to-dos yet", id='todos-empty', style=EMPTY_STATE_STYLE),
+            html.Div(id='todos-list', children=[])
         ])
     ])
 
@@ -1541,6 +1643,10 @@ app.layout = html.Div(
     **{'data-theme': 'light'},  # Default theme, updated by callback # type: ignore
     children=[
         dcc.Store(id='app-state', data=app_state),
+        dcc.Store(id='notes-store', data=notes_state),
+        dcc.Store(id='todos-store', data=todos_state),
+        dcc.Store(id='robot-status-store', data=robot_status_state),
+        dcc.Store(id='stats-store', data=stats_state),
         dcc.Interval(id='update-interval', interval=1000),  # Update every second
         
         create_top_nav(),
@@ -1642,8 +1748,8 @@ def update_view(clicks, sidebar_class):
         
         view_func = view_functions.get(view, create_dashboard_view)
         content = view_func()
-    except Exception as e:
-        print(f"Error rendering view {view}: {e}")
+    except Exception:
+        logger.exception("Error rendering view %s", view)
         content = create_dashboard_view()
     
     class_name = 'main-content expanded' if 'collapsed' in (sidebar_class or '') else 'main-content'
@@ -1729,15 +1835,15 @@ def handle_core_control_buttons(start_clicks, stop_clicks, run_clicks, skip_clic
     
     if button_id == 'start-tuner-btn':
         state['tuner_enabled'] = True
-        print("✅ Tuner Started")
+        logger.info("✅ Tuner Started")
     elif button_id == 'stop-tuner-btn':
         state['tuner_enabled'] = False
-        print("⛔ Tuner Stopped")
+        logger.info("⛔ Tuner Stopped")
     elif button_id == 'run-optimization-btn':
-        print("🔄 Running Optimization...")
+        logger.info("🔄 Running Optimization...")
         # In a real implementation, this would trigger the optimization
     elif button_id == 'skip-coefficient-btn':
-        print("⏭️ Skipping to Next Coefficient")
+        logger.info("⏭️ Skipping to Next Coefficient")
         # In a real implementation, this would advance to the next coefficient
     
     return state
@@ -1765,11 +1871,11 @@ def handle_coefficient_navigation(prev_clicks, next_clicks, state):
     if button_id == 'prev-coeff-btn':
         new_idx = (current_idx - 1) % len(coefficients)
         state['current_coefficient'] = coefficients[new_idx]
-        print(f"⬅️ Previous Coefficient: {state['current_coefficient']}")
+        logger.info("⬅️ Previous Coefficient: %s", state['current_coefficient'])
     elif button_id == 'next-coeff-btn':
         new_idx = (current_idx + 1) % len(coefficients)
         state['current_coefficient'] = coefficients[new_idx]
-        print(f"➡️ Next Coefficient: {state['current_coefficient']}")
+        logger.info("➡️ Next Coefficient: %s", state['current_coefficient'])
     
     return state
 
@@ -1791,11 +1897,11 @@ def handle_fine_tuning_buttons(up_clicks, down_clicks, reset_clicks, state):
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if button_id == 'fine-tune-up-btn':
-        print("⬆️ Fine Tune Up")
+        logger.info("⬆️ Fine Tune Up")
     elif button_id == 'fine-tune-down-btn':
-        print("⬇️ Fine Tune Down")
+        logger.info("⬇️ Fine Tune Down")
     elif button_id == 'fine-tune-reset-btn':
-        print("🔄 Fine Tune Reset")
+        logger.info("🔄 Fine Tune Reset")
     
     return state
 
@@ -1837,29 +1943,29 @@ def handle_coefficient_bulk_actions(increase_clicks, decrease_clicks, reset_clic
     current_values = [drag_val, grav_val, shot_val, target_val, angle_val, rpm_val, velocity_val]
     
     if button_id == 'increase-all-btn':
-        print("⬆️ Increasing All Coefficients by 10%")
+        logger.info("⬆️ Increasing All Coefficients by 10%")
         # Increase all coefficient values by 10%, clamping to max
         new_values = [clamp_coefficient_value(v * 1.1, name) for v, name in zip(current_values, COEFFICIENT_NAMES)]
         return new_values + [state]
         
     elif button_id == 'decrease-all-btn':
-        print("⬇️ Decreasing All Coefficients by 10%")
+        logger.info("⬇️ Decreasing All Coefficients by 10%")
         # Decrease all coefficient values by 10%, clamping to min
         new_values = [clamp_coefficient_value(v * 0.9, name) for v, name in zip(current_values, COEFFICIENT_NAMES)]
         return new_values + [state]
         
     elif button_id == 'reset-all-coeff-btn':
-        print("🔄 Resetting All Coefficients to Defaults")
+        logger.info("🔄 Resetting All Coefficients to Defaults")
         # Reset all coefficients to defaults using COEFFICIENT_NAMES for consistent ordering
         state['coefficient_values'] = {}
         default_values = [COEFFICIENT_DEFAULTS[name] for name in COEFFICIENT_NAMES]
         return default_values + [state]
         
     elif button_id == 'copy-coeff-btn':
-        print("📋 Copied Current Coefficient Values")
+        logger.info("📋 Copied Current Coefficient Values")
         # Log current values (in real implementation, would copy to clipboard)
         for name, value in zip(COEFFICIENT_NAMES, current_values):
-            print(f"  {name}: {value}")
+            logger.info("  %s: %s", name, value)
         return current_values + [state]
     
     return current_values + [state]
@@ -1889,7 +1995,7 @@ def handle_coefficient_sliders(slider_values, state):
                 if 'coefficient_values' not in state:
                     state['coefficient_values'] = {}
                 state['coefficient_values'][coeff_name] = new_value
-                print(f"📊 {coeff_name} = {new_value}")
+                logger.info("📊 %s = %s", coeff_name, new_value)
         except (json.JSONDecodeError, KeyError, TypeError):
             pass
     
@@ -1963,19 +2069,19 @@ def handle_coefficient_fine_adjustments(inc_clicks, dec_clicks, inc_large_clicks
 
         if button_type == 'fine-inc':
             new_value = min(current_value + step, max_val)
-            print(f"➕ {coeff_name}: {current_value:.4f} → {new_value:.4f} (+{step})")
+            logger.info("➕ %s: %.4f → %.4f (+%s)", coeff_name, current_value, new_value, step)
         elif button_type == 'fine-dec':
             new_value = max(current_value - step, min_val)
-            print(f"➖ {coeff_name}: {current_value:.4f} → {new_value:.4f} (-{step})")
+            logger.info("➖ %s: %.4f → %.4f (-%s)", coeff_name, current_value, new_value, step)
         elif button_type == 'fine-inc-large':
             new_value = min(current_value + (step * 10), max_val)
-            print(f"➕➕ {coeff_name}: {current_value:.4f} → {new_value:.4f} (+{step * 10})")
+            logger.info("➕➕ %s: %.4f → %.4f (+%s)", coeff_name, current_value, new_value, step * 10)
         elif button_type == 'fine-dec-large':
             new_value = max(current_value - (step * 10), min_val)
-            print(f"➖➖ {coeff_name}: {current_value:.4f} → {new_value:.4f} (-{step * 10})")
+            logger.info("➖➖ %s: %.4f → %.4f (-%s)", coeff_name, current_value, new_value, step * 10)
         elif button_type == 'reset-coeff':
             new_value = COEFFICIENT_DEFAULTS.get(coeff_name, current_value)
-            print(f"🔄 Reset {coeff_name}: {current_value:.4f} → {new_value:.4f} (default)")
+            logger.info("🔄 Reset %s: %.4f → %.4f (default)", coeff_name, current_value, new_value)
         
         # Update the specific coefficient value
         new_slider_values = current_slider_values.copy()
@@ -1989,8 +2095,8 @@ def handle_coefficient_fine_adjustments(inc_clicks, dec_clicks, inc_large_clicks
         # Return all slider values plus state
         return new_slider_values + [state]
         
-    except Exception as e:
-        print(f"Error in coefficient fine adjustment: {e}")
+    except Exception:
+        logger.exception("Error in coefficient fine adjustment")
         return no_update
 
 
@@ -2012,7 +2118,7 @@ def handle_jump_to_buttons(clicks, state):
             button_data = json.loads(triggered_id)
             coeff_name = button_data.get('index')
             state['current_coefficient'] = coeff_name
-            print(f"⤵️ Jumped to {coeff_name}")
+            logger.info("⤵️ Jumped to %s", coeff_name)
         except (json.JSONDecodeError, KeyError, TypeError):
             pass
     
@@ -2050,15 +2156,15 @@ def handle_pin_coefficient_buttons(clicks, slider_values, state):
                 # Toggle: if already pinned, unpin it; otherwise pin it
                 if coeff_name in state['pinned_values']:
                     del state['pinned_values'][coeff_name]
-                    print(f"🔓 Unpinned {coeff_name}")
+                    logger.info("🔓 Unpinned %s", coeff_name)
                 else:
                     state['pinned_values'][coeff_name] = {
                         'value': current_value,
                         'timestamp': datetime.now().strftime('%I:%M:%S %p')
                     }
-                    print(f"📌 Pinned {coeff_name} = {current_value}")
-        except (json.JSONDecodeError, KeyError, TypeError, IndexError) as e:
-            print(f"Error toggling pin for coefficient: {e}")
+                    logger.info("📌 Pinned %s = %s", coeff_name, current_value)
+        except (json.JSONDecodeError, KeyError, TypeError, IndexError):
+            logger.exception("Error toggling pin for coefficient")
     
     return state
 
@@ -2073,36 +2179,31 @@ def update_pinned_values_display(state):
     pinned_values = state.get('pinned_values', {})
     
     if not pinned_values:
-        return [html.P("No pinned values yet. Click 📌 on any coefficient to pin it.", 
-                      style={'fontStyle': 'italic', 'color': 'var(--text-secondary)'})]
+        return EMPTY_PINNED_VALUES
     
-    # Create a list of pinned value cards
-    pinned_cards = []
-    for coeff_name, pin_data in pinned_values.items():
-        pinned_cards.append(
-            html.Div(
-                className="card",
-                style={'marginBottom': '8px', 'padding': '12px'},
-                children=[
-                    html.Div(style={'display': 'flex', 'justifyContent': 'space-between', 'alignItems': 'center'}, children=[
-                        html.Div([
-                            html.Span("📌 ", style={'fontSize': '16px'}),
-                            html.Span(coeff_name, style={'fontWeight': 'bold', 'marginRight': '8px'}),
-                            html.Span(f"= {pin_data['value']}", style={'color': 'var(--accent-primary)', 'fontWeight': 'bold'}),
-                        ]),
-                        html.Div(style={'display': 'flex', 'gap': '8px', 'alignItems': 'center'}, children=[
-                            html.Small(f"Pinned at {pin_data['timestamp']}", 
-                                     style={'fontSize': '11px', 'color': 'var(--text-secondary)', 'marginRight': '8px'}),
-                            dbc.Button("🗑️", id={'type': 'unpin-coeff-btn', 'index': coeff_name}, 
-                                     size="sm", className="btn-secondary", title="Unpin this coefficient",
-                                     style={'padding': '2px 8px', 'fontSize': '12px'})
-                        ])
-                    ])
-                ]
+    # Build the pinned value cards in one pass straight into a tuple
+    return tuple(
+        html.Div(
+            className="card",
+            style=PINNED_CARD_STYLE,
+            children=(
+                html.Div(style=PINNED_CARD_ROW_STYLE, children=(
+                    html.Div((
+                        html.Span("📌 ", style=PINNED_CARD_ICON_STYLE),
+                        html.Span(coeff_name, style=PINNED_CARD_NAME_STYLE),
+                        html.Span(f"= {pin_data['value']}", style=PINNED_CARD_VALUE_STYLE),
+                    )),
+                    html.Div(style=PINNED_CARD_ACTIONS_STYLE, children=(
+                        html.Small(f"Pinned at {pin_data['timestamp']}", style=PINNED_CARD_TIME_STYLE),
+                        dbc.Button("🗑️", id={'type': 'unpin-coeff-btn', 'index': coeff_name}, 
+                                 size="sm", className="btn-secondary", title="Unpin this coefficient",
+                                 style=PINNED_CARD_UNPIN_STYLE)
+                    ))
+                )),
             )
         )
-    
-    return pinned_cards
+        for coeff_name, pin_data in pinned_values.items()
+    )
 
 
 @app.callback(
@@ -2126,9 +2227,9 @@ def handle_unpin_coefficient_buttons(clicks, state):
             # Remove from pinned values if it exists
             if 'pinned_values' in state and coeff_name in state['pinned_values']:
                 del state['pinned_values'][coeff_name]
-                print(f"🗑️ Unpinned {coeff_name}")
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            print(f"Error unpinning coefficient: {e}")
+                logger.info("🗑️ Unpinned %s", coeff_name)
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.exception("Error unpinning coefficient")
     
     return state
 
@@ -2145,26 +2246,20 @@ def update_pin_button_appearance(state, button_id):
     """Update pin button appearance based on whether coefficient is pinned."""
     # Safely get coefficient name from button_id
     if not button_id or not isinstance(button_id, dict):
-        return "📌", {}, "Click to pin this value"
+        return "📌", UNPINNED_BUTTON_STYLE, "Click to pin this value"
     
     coeff_name = button_id.get('index')
     if not coeff_name:
-        return "📌", {}, "Click to pin this value"
+        return "📌", UNPINNED_BUTTON_STYLE, "Click to pin this value"
     
     pinned_values = state.get('pinned_values', {})
     
     if coeff_name in pinned_values:
         # Coefficient is pinned - show as orange/pinned
-        # Using inline style since we can't access CSS variables in style dict
-        return "📌", {
-            'backgroundColor': '#ff6b35',  # Orange accent color
-            'borderColor': '#ff6b35',
-            'color': 'white',
-            'fontWeight': 'bold'
-        }, f"Click to unpin {coeff_name}"
+        return "📌", PINNED_BUTTON_STYLE, f"Click to unpin {coeff_name}"
     else:
         # Coefficient is not pinned - show as default gray
-        return "📌", {}, "Click to pin this value"
+        return "📌", UNPINNED_BUTTON_STYLE, "Click to pin this value"
 
 
 @app.callback(
@@ -2176,20 +2271,20 @@ def update_pin_button_appearance(state, button_id):
 def update_coefficient_card_highlight(state, card_id):
     """Update coefficient card background to highlight the currently active coefficient."""
     if not card_id or not isinstance(card_id, dict):
-        return {'marginBottom': '12px'}
+        return COEFF_CARD_STYLE
     
     coeff_name = card_id.get('index')
     if not coeff_name:
-        return {'marginBottom': '12px'}
+        return COEFF_CARD_STYLE
     
     current_coeff = state.get('current_coefficient', 'kDragCoefficient')
     
     if coeff_name == current_coeff:
         # Highlight the current coefficient
-        return {'marginBottom': '12px', 'backgroundColor': 'var(--accent-subtle)'}
+        return COEFF_CARD_ACTIVE_STYLE
     else:
         # Default background
-        return {'marginBottom': '12px', 'backgroundColor': 'var(--bg-primary)'}
+        return COEFF_CARD_INACTIVE_STYLE
 
 
 @app.callback(
@@ -2209,11 +2304,11 @@ def handle_graph_controls(export_clicks, refresh_clicks, pause_clicks, state):
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if button_id == 'export-graphs-btn':
-        print("📥 Exporting All Graphs...")
+        logger.info("📥 Exporting All Graphs...")
     elif button_id == 'refresh-graphs-btn':
-        print("🔄 Refreshing Graph Data...")
+        logger.info("🔄 Refreshing Graph Data...")
     elif button_id == 'pause-graphs-btn':
-        print("⏸️ Toggling Graph Auto-Update")
+        logger.info("⏸️ Toggling Graph Auto-Update")
     
     return state
 
@@ -2245,9 +2340,9 @@ def toggle_graph_visibility(selected_graphs):
     styles = []
     for graph_id in graph_ids:
         if graph_id in selected_graphs:
-            styles.append({'display': 'block'})
+            styles.append(VISIBLE_STYLE)
         else:
-            styles.append({'display': 'none'})
+            styles.append(HIDDEN_STYLE)
     
     return styles
 
@@ -2270,13 +2365,13 @@ def handle_workflow_controls(start_clicks, skip_clicks, prev_clicks, reset_click
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if button_id == 'start-workflow-btn':
-        print("▶️ Starting Workflow from Beginning")
+        logger.info("▶️ Starting Workflow from Beginning")
     elif button_id == 'skip-workflow-btn':
-        print("⏭️ Skipping to Next in Workflow")
+        logger.info("⏭️ Skipping to Next in Workflow")
     elif button_id == 'prev-workflow-btn':
-        print("⏮️ Going to Previous in Workflow")
+        logger.info("⏮️ Going to Previous in Workflow")
     elif button_id == 'reset-workflow-btn':
-        print("🔄 Resetting Workflow Progress")
+        logger.info("🔄 Resetting Workflow Progress")
     
     return state
 
@@ -2298,7 +2393,7 @@ def handle_backtrack_buttons(clicks, state):
         try:
             button_data = json.loads(triggered_id)
             coeff_name = button_data.get('index')
-            print(f"⏪ Backtracking to {coeff_name}")
+            logger.info("⏪ Backtracking to %s", coeff_name)
         except (json.JSONDecodeError, KeyError, TypeError):
             pass
     
@@ -2322,11 +2417,11 @@ def handle_session_management(save_clicks, load_clicks, export_clicks, state):
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if button_id == 'save-session-btn':
-        print("💾 Saving Session...")
+        logger.info("💾 Saving Session...")
     elif button_id == 'load-session-btn':
-        print("📁 Loading Session...")
+        logger.info("📁 Loading Session...")
     elif button_id == 'export-session-btn':
-        print("📤 Exporting Session Data...")
+        logger.info("📤 Exporting Session Data...")
     
     return state
 
@@ -2349,29 +2444,30 @@ def handle_settings_buttons(save_clicks, load_clicks, reset_clicks, baseline_cli
     button_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if button_id == 'save-settings-btn':
-        print("💾 Saving Settings...")
+        logger.info("💾 Saving Settings...")
     elif button_id == 'load-settings-btn':
-        print("📁 Loading Settings...")
+        logger.info("📁 Loading Settings...")
     elif button_id == 'reset-settings-btn':
-        print("🔄 Resetting Settings to Defaults...")
+        logger.info("🔄 Resetting Settings to Defaults...")
     elif button_id == 'set-baseline-btn':
-        print("⭐ Setting Current Values as Baseline")
+        logger.info("⭐ Setting Current Values as Baseline")
     
     return state
 
 
 @app.callback(
-    [Output('notes-list', 'children'),
+    [Output('notes-list', 'children', allow_duplicate=True),
+     Output('notes-empty', 'style', allow_duplicate=True),
+     Output('notes-store', 'data'),
      Output('note-input', 'value')],
     [Input('add-note-btn', 'n_clicks')],
-    [State('note-input', 'value'),
-     State('app-state', 'data')],
+    [State('note-input', 'value')],
     prevent_initial_call=True
 )
-def handle_add_note(clicks, note_text, state):
+def handle_add_note(clicks, note_text):
     """Handle adding a new note."""
     if not clicks or not note_text:
-        return dash.no_update, dash.no_update
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update
     
     timestamp = datetime.now().strftime('%I:%M:%S %p')
     new_note = html.Div(
@@ -2383,136 +2479,193 @@ def handle_add_note(clicks, note_text, state):
         ]
     )
     
-    # Get current notes
-    if 'notes' not in state:
-        state['notes'] = []
-    
-    state['notes'].insert(0, {'time': timestamp, 'text': note_text})
-    
-    # Create list of note elements
-    notes_elements = [
-        html.Div(
-            className="card",
-            style={'marginBottom': '8px', 'padding': '12px'},
-            children=[
-                html.Div(f"[{note['time']}]", style={'fontSize': '12px', 'color': 'var(--text-secondary)'}),
-                html.P(note['text'], style={'margin': '4px 0 0 0'})
-            ]
-        ) for note in state['notes']
-    ]
+    # Newest note goes first - ship only the new element/record instead of the whole list;
+    # the store keeps the card so the list can be restored when the view remounts
+    patched_notes = Patch()
+    patched_notes.prepend(new_note)
+    patched_store = Patch()
+    patched_store.prepend({'time': timestamp, 'text': note_text, 'card': new_note})
     
-    print(f"📝 Added Note: {note_text}")
+    logger.info("📝 Added Note: %s", note_text)
     
-    return notes_elements if notes_elements else [html.P("No notes yet", style={'fontStyle': 'italic', 'color': 'var(--text-secondary)'})], ""
+    return patched_notes, HIDDEN_STYLE, patched_store, ""
 
 
 @app.callback(
-    [Output('todos-list', 'children'),
+    [Output('todos-list', 'children', allow_duplicate=True),
+     Output('todos-empty', 'style', allow_duplicate=True),
+     Output('todos-store', 'data'),
      Output('todo-input', 'value')],
     [Input('add-todo-btn', 'n_clicks')],
-    [State('todo-input', 'value'),
-     State('app-state', 'data')],
+    [State('todo-input', 'value')],
     prevent_initial_call=True
 )
-def handle_add_todo(clicks, todo_text, state):
+def handle_add_todo(clicks, todo_text):
     """Handle adding a new to-do item."""
     if not clicks or not todo_text:
-        return dash.no_update, dash.no_update
+        return dash.no_update, dash.no_update, dash.no_update, dash.no_update
     
-    if 'todos' not in state:
-        state['todos'] = []
-    
-    state['todos'].append({'text': todo_text, 'done': False})
+    # Build the card once; the store keeps it so the list never needs rebuilding
+    todo_card = html.Div(
+        className="card",
+        style={'marginBottom': '8px', 'padding': '12px', 'display': 'flex', 'alignItems': 'center'},
+        children=[
+            dbc.Checklist(
+                options=[{'label': todo_text, 'value': 'done'}],
+                value=TODO_NOT_DONE_VALUE,
+                inline=True
+            )
+        ]
+    )
     
-    # Create list of todo elements
-    todos_elements = [
-        html.Div(
-            className="card",
-            style={'marginBottom': '8px', 'padding': '12px', 'display': 'flex', 'alignItems': 'center'},
-            children=[
-                dbc.Checklist(
-                    options=[{'label': todo['text'], 'value': 'done'}],
-                    value=['done'] if todo.get('done', False) else [],
-                    inline=True
-                )
-            ]
-        ) for todo in state['todos']
-    ]
+    # Append only the new to-do instead of re-rendering the whole list
+    patched_todos = Patch()
+    patched_todos.append(todo_card)
+    patched_store = Patch()
+    patched_store.append({'text': todo_text, 'done': False, 'card': todo_card})
     
-    print(f"✅ Added To-Do: {todo_text}")
+    logger.info("✅ Added To-Do: %s", todo_text)
     
-    return todos_elements if todos_elements else [html.P("No to-dos yet", style={'fontStyle': 'italic', 'color': 'var(--text-secondary)'})], ""
+    return patched_todos, HIDDEN_STYLE, patched_store, ""
+
+
+# Clientside callback to restore the prebuilt note cards when the notes view mounts
+app.clientside_callback(
+    """
+    function(list_id, notes) {
+        if (!notes || notes.length === 0) {
+            return [dash_clientside.no_update, dash_clientside.no_update];
+        }
+        return [notes.map(note => note.card), {display: 'none'}];
+    }
+    """,
+    [Output('notes-list', 'children'),
+     Output('notes-empty', 'style')],
+    [Input('notes-list', 'id')],
+    [State('notes-store', 'data')]
+)
+
+
+# Clientside callback to restore the prebuilt to-do cards when the notes view mounts
+app.clientside_callback(
+    """
+    function(list_id, todos) {
+        if (!todos || todos.length === 0) {
+            return [dash_clientside.no_update, dash_clientside.no_update];
+        }
+        return [todos.map(todo => todo.card), {display: 'none'}];
+    }
+    """,
+    [Output('todos-list', 'children'),
+     Output('todos-empty', 'style')],
+    [Input('todos-list', 'id')],
+    [State('todos-store', 'data')]
+)
+
+
+# Server-side danger zone actions keyed by button id
+DANGER_ZONE_MESSAGES = {
+    'reconfigure-base-btn': "⚙️ Reconfiguring Base Point...",
+    'restore-defaults-btn': "🔄 Restoring Factory Defaults...",
+    'export-config-btn': "📤 Exporting Configuration...",
+    'import-config-btn': "📥 Importing Configuration...",
+    'force-retune-btn': "🔄 Forcing Retune of Current Coefficient...",
+}
 
 
 @app.callback(
     Output('app-state', 'data', allow_duplicate=True),
     [Input('reconfigure-base-btn', 'n_clicks'),
      Input('restore-defaults-btn', 'n_clicks'),
-     Input('lock-config-btn', 'n_clicks'),
      Input('export-config-btn', 'n_clicks'),
      Input('import-config-btn', 'n_clicks'),
-     Input('reset-data-btn', 'n_clicks'),
-     Input('clear-pinned-btn', 'n_clicks'),
-     Input('emergency-stop-btn', 'n_clicks'),
      Input('force-retune-btn', 'n_clicks')],
-    [State('app-state', 'data')],
     prevent_initial_call=True
 )
-def handle_danger_zone_buttons(reconfig_clicks, restore_clicks, lock_clicks, export_clicks,
-                                import_clicks, reset_clicks, clear_clicks, emergency_clicks,
-                                retune_clicks, state):
+def handle_danger_zone_buttons(reconfig_clicks, restore_clicks, export_clicks,
+                                import_clicks, retune_clicks):
     """Handle danger zone buttons with appropriate warnings."""
+    # Only logs: app-state is never sent up or written back, so this can't
+    # overwrite a concurrent clientside change with stale data
     ctx = callback_context
-    if not ctx.triggered:
-        return state
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    if button_id == 'reconfigure-base-btn':
-        print("⚙️ Reconfiguring Base Point...")
-    elif button_id == 'restore-defaults-btn':
-        print("🔄 Restoring Factory Defaults...")
-    elif button_id == 'lock-config-btn':
-        state['config_locked'] = not state.get('config_locked', False)
-        status = "Locked" if state['config_locked'] else "Unlocked"
-        print(f"🔐 Configuration {status}")
-    elif button_id == 'export-config-btn':
-        print("📤 Exporting Configuration...")
-    elif button_id == 'import-config-btn':
-        print("📥 Importing Configuration...")
-    elif button_id == 'reset-data-btn':
-        print("⚠️ Resetting All Tuning Data...")
-        state['coefficient_values'] = {}
-        state['shot_count'] = 0
-        state['success_rate'] = 0.0
-    elif button_id == 'clear-pinned-btn':
-        print("🧹 Clearing All Pinned Data...")
-        state['pinned_values'] = {}
-    elif button_id == 'emergency-stop-btn':
-        print("🔥 EMERGENCY STOP!")
-        state['tuner_enabled'] = False
-    elif button_id == 'force-retune-btn':
-        print("🔄 Forcing Retune of Current Coefficient...")
+    if ctx.triggered:
+        button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+        message = DANGER_ZONE_MESSAGES.get(button_id)
+        if message:
+            logger.info(message)
     
-    return state
+    return no_update
+
+
+# Clientside callback for danger zone buttons that only mutate app-state,
+# so toggling them never needs a server roundtrip
+app.clientside_callback(
+    """
+    function(lock_clicks, reset_clicks, clear_clicks, emergency_clicks, state) {
+        const no_update = dash_clientside.no_update;
+        const ctx = dash_clientside.callback_context;
+        if (!ctx.triggered || ctx.triggered.length === 0) {
+            return [no_update, no_update];
+        }
+        const button_id = ctx.triggered[0].prop_id.split('.')[0];
+        const s = Object.assign({}, state || {});
+        if (button_id === 'lock-config-btn') {
+            s.config_locked = !s.config_locked;
+        } else if (button_id === 'reset-data-btn') {
+            s.coefficient_values = {};
+            return [s, {shot_count: 0, success_rate: 0.0}];
+        } else if (button_id === 'clear-pinned-btn') {
+            s.pinned_values = {};
+        } else if (button_id === 'emergency-stop-btn') {
+            s.tuner_enabled = false;
+        } else {
+            return [no_update, no_update];
+        }
+        return [s, no_update];
+    }
+    """,
+    [Output('app-state', 'data', allow_duplicate=True),
+     Output('stats-store', 'data')],
+    [Input('lock-config-btn', 'n_clicks'),
+     Input('reset-data-btn', 'n_clicks'),
+     Input('clear-pinned-btn', 'n_clicks'),
+     Input('emergency-stop-btn', 'n_clicks')],
+    [State('app-state', 'data')],
+    prevent_initial_call=True
+)
 
 
 @app.callback(
     [Output('coeff-display', 'children'),
      Output('shot-display', 'children'),
      Output('success-display', 'children')],
-    [Input('app-state', 'data')]
+    [Input('app-state', 'data'),
+     Input('stats-store', 'data')],
+    [State('coeff-display', 'children'),
+     State('shot-display', 'children'),
+     State('success-display', 'children')]
 )
-def update_dashboard_displays(state):
-    """Update the dashboard display values."""
+def update_dashboard_displays(state, stats, current_coeff, current_shots, current_success):
+    """Update the dashboard display values, skipping any that haven't changed."""
     coeff = state.get('current_coefficient', 'kDragCoefficient')
-    shots = state.get('shot_count', 0)
-    success = state.get('success_rate', 0.0)
+    shots = str(stats.get('shot_count', 0))
+    success = f"{stats.get('success_rate', 0.0):.1%}"
+    
+    # Most app-state changes (pins, locks, navigation) don't touch these values
+    if coeff == current_coeff and shots == current_shots and success == current_success:
+        raise PreventUpdate
     
-    return coeff, str(shots), f"{success:.1%}"
+    return (
+        coeff if coeff != current_coeff else no_update,
+        shots if shots != current_shots else no_update,
+        success if success != current_success else no_update
+    )
 
 
-@app.callback(
+# Clientside callback for robot status displays - pure presentation, no server roundtrip.
+# Defined in assets/JavaScript/clientside_callbacks.js so its style objects are shared constants.
+app.clientside_callback(
+    ClientsideFunction(namespace='robot', function_name='status_displays'),
     [Output('robot-battery', 'children'),
      Output('robot-battery', 'style'),
      Output('robot-cpu', 'children'),
@@ -2523,50 +2676,8 @@ def update_dashboard_displays(state):
      Output('robot-can', 'style'),
      Output('robot-loop-time', 'children'),
      Output('robot-loop-time', 'style')],
-    [Input('app-state', 'data')]
-)
-def update_robot_status_displays(state):
-    """Update robot status displays - clear when disconnected."""
-    connection_status = state.get('connection_status', 'disconnected')
-    
-    if connection_status == 'disconnected' or not connection_status or connection_status == '':
-        # Robot is disconnected - show N/A for all values
-        na_style = {'fontSize': '24px', 'fontWeight': '600', 'color': 'var(--text-secondary)'}
-        return (
-            "N/A", na_style,
-            "N/A", na_style,
-            "N/A", na_style,
-            "N/A", na_style,
-            "N/A", na_style
-        )
-    else:
-        # Robot is connected - show actual values (placeholder for now)
-        return (
-            "12.4V", {'fontSize': '24px', 'fontWeight': '600', 'color': 'var(--success)'},
-            "34%", {'fontSize': '24px', 'fontWeight': '600', 'color': 'var(--info)'},
-            "128MB", {'fontSize': '24px', 'fontWeight': '600', 'color': 'var(--info)'},
-            "42%", {'fontSize': '24px', 'fontWeight': '600', 'color': 'var(--success)'},
-            "18ms", {'fontSize': '24px', 'fontWeight': '600', 'color': 'var(--success)'}
-        )
-
-
-@app.callback(
-    [Output('status-bar-time', 'children'),
-     Output('status-bar-date', 'children'),
-     Output('status-bar-shots', 'children'),
-     Output('status-bar-success', 'children')],
-    [Input('update-interval', 'n_intervals')],
-    [State('app-state', 'data')]
+    [Input('robot-status-store', 'data')]
 )
-def update_status_bar(n_intervals, state):
-    """Update the status bar with current time and stats."""
-    # Use JavaScript on client side for accurate local time
-    # For now, we'll return empty and handle with clientside callback
-    shots = str(state.get('shot_count', 0))
-    success = f"{state.get('success_rate', 0.0):.1%}"
-    
-    # Return placeholders for time/date - will be updated by clientside callback
-    return no_update, no_update, shots, success
 
 
 # Clientside callback to update time/date with user's local timezone
@@ -2579,75 +2690,95 @@ app.clientside_callback(
         return [timeStr, dateStr];
     }
     """,
-    [Output('status-bar-time', 'children', allow_duplicate=True),
-     Output('status-bar-date', 'children', allow_duplicate=True)],
+    [Output('status-bar-time', 'children'),
+     Output('status-bar-date', 'children')],
     [Input('update-interval', 'n_intervals')],
     prevent_initial_call=True
 )
 
 
+# Clientside callback to update shot stats in the status bar only when they change
+app.clientside_callback(
+    """
+    function(stats) {
+        const s = stats || {};
+        const shots = String(s.shot_count || 0);
+        const success = ((s.success_rate || 0) * 100).toFixed(1) + '%';
+        return [shots, success];
+    }
+    """,
+    [Output('status-bar-shots', 'children'),
+     Output('status-bar-success', 'children')],
+    [Input('stats-store', 'data')]
+)
+
+
 @app.callback(
-    [Output({'type': 'coeff-current-display', 'index': 'kDragCoefficient'}, 'children'),
-     Output({'type': 'coeff-current-display', 'index': 'kGravity'}, 'children'),
-     Output({'type': 'coeff-current-display', 'index': 'kShotHeight'}, 'children'),
-     Output({'type': 'coeff-current-display', 'index': 'kTargetHeight'}, 'children'),
-     Output({'type': 'coeff-current-display', 'index': 'kShooterAngle'}, 'children'),
-     Output({'type': 'coeff-current-display', 'index': 'kShooterRPM'}, 'children'),
-     Output({'type': 'coeff-current-display', 'index': 'kExitVelocity'}, 'children')],
-    [Input({'type': 'coeff-slider', 'index': 'kDragCoefficient'}, 'value'),
-     Input({'type': 'coeff-slider', 'index': 'kGravity'}, 'value'),
-     Input({'type': 'coeff-slider', 'index': 'kShotHeight'}, 'value'),
-     Input({'type': 'coeff-slider', 'index': 'kTargetHeight'}, 'value'),
-     Input({'type': 'coeff-slider', 'index': 'kShooterAngle'}, 'value'),
-     Input({'type': 'coeff-slider', 'index': 'kShooterRPM'}, 'value'),
-     Input({'type': 'coeff-slider', 'index': 'kExitVelocity'}, 'value')],
+    Output({'type': 'coeff-current-display', 'index': ALL}, 'children'),
+    [Input({'type': 'coeff-slider', 'index': ALL}, 'value')],
     prevent_initial_call=False
 )
-def update_coefficient_current_displays(drag_val, grav_val, shot_val, target_val, angle_val, rpm_val, velocity_val):
+def update_coefficient_current_displays(slider_values):
     """Update the 'Current:' value displays in coefficient headers when sliders change."""
-    # Format each value appropriately based on its type
-    def format_value(val, coeff_name):
-        config = COEFFICIENT_CONFIG.get(coeff_name, {})
-        step = config.get('step', 0.1)
-        # If step is very small, show more decimal places
-        if step < 0.01:
-            return f"{val:.4f}"
-        elif step < 1:
-            return f"{val:.2f}"
-        else:
-            return f"{val:.0f}"
-    
-    return (
-        format_value(drag_val, 'kDragCoefficient'),
-        format_value(grav_val, 'kGravity'),
-        format_value(shot_val, 'kShotHeight'),
-        format_value(target_val, 'kTargetHeight'),
-        format_value(angle_val, 'kShooterAngle'),
-        format_value(rpm_val, 'kShooterRPM'),
-        format_value(velocity_val, 'kExitVelocity')
-    )
-
+    ctx = callback_context
+    # Match displays to sliders by coefficient name rather than relying on layout order
+    values_by_name = {
+        slider['id']['index']: value
+        for slider, value in zip(ctx.inputs_list[0], slider_values)
+    }
+    formats = COEFFICIENT_DISPLAY_FORMATS
+    return [
+        formats[display['id']['index']].format(values_by_name[display['id']['index']])
+        for display in ctx.outputs_list
+    ]
 
-if __name__ == '__main__':
-    import webbrowser, threading, time
-    import os
 
-    print("=" * 60)
-    print("MLtune Dashboard Starting")
-    print("=" * 60)
-    print(f"Opening browser to: http://localhost:8050")
-    print("=" * 60)
-    print(f"Tuner integration: {'Available' if TUNER_AVAILABLE else 'Demo mode'}")
+def open_browser_when_ready(url='http://localhost:8050', port=8050, timeout=15.0):
+    """
+    Open the dashboard in a browser as soon as the server accepts connections.
+    
+    Args:
+        url: The URL to open
+        port: The local port the Dash server listens on
+        timeout: Maximum seconds to wait for the server before giving up
+    """
+    import socket
+    import time
+    import webbrowser
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.25):
+                webbrowser.open(url)
+                return
+        except OSError:
+            time.sleep(0.05)
+    logger.warning("Dashboard server not reachable on port %s; open %s manually", port, url)
 
-    # Open browser after a short delay to ensure server is ready
-    def open_browser():
-        time.sleep(1.5)
-        webbrowser.open('http://localhost:8050')
 
-    # Start the browser in a background thread
-    threading.Thread(target=open_browser, daemon=True).start()
+def main():
+    """Start the dashboard server and open it in the browser."""
+    import threading
+    
+    print(STARTUP_BANNER)
+    
+    # Open the browser in a background thread once the server is listening
+    threading.Thread(target=open_browser_when_ready, daemon=True).start()
     
     # Use debug mode only in development, not in production
     debug_mode = os.environ.get('DASH_DEBUG', 'false').lower() == 'true'
-    app.run(debug=debug_mode, host='0.0.0.0', port=8050)
-    
+    # Dev tools (hot reload polling, props validation) only when debugging
+    app.run(
+        debug=debug_mode,
+        dev_tools_hot_reload=debug_mode,
+        dev_tools_props_check=debug_mode,
+        dev_tools_ui=debug_mode,
+        dev_tools_serve_dev_bundles=debug_mode,
+        host='0.0.0.0',
+        port=8050
+    )
+
+
+if __name__ == '__main__':
+    main()
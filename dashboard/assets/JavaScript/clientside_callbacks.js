@@ -0,0 +1,36 @@
+// Clientside callback functions referenced from app.py via ClientsideFunction
+(function() {
+    // Style objects are built once so every callback returns the same references
+    const ROBOT_STAT_NA_STYLE = Object.freeze({fontSize: '24px', fontWeight: '600', color: 'var(--text-secondary)'});
+    const ROBOT_STAT_OK_STYLE = Object.freeze({fontSize: '24px', fontWeight: '600', color: 'var(--success)'});
+    const ROBOT_STAT_INFO_STYLE = Object.freeze({fontSize: '24px', fontWeight: '600', color: 'var(--info)'});
+
+    const ROBOT_STATUS_DISCONNECTED = Object.freeze([
+        'N/A', ROBOT_STAT_NA_STYLE,
+        'N/A', ROBOT_STAT_NA_STYLE,
+        'N/A', ROBOT_STAT_NA_STYLE,
+        'N/A', ROBOT_STAT_NA_STYLE,
+        'N/A', ROBOT_STAT_NA_STYLE
+    ]);
+    // Placeholder values until live robot telemetry is wired up
+    const ROBOT_STATUS_CONNECTED = Object.freeze([
+        '12.4V', ROBOT_STAT_OK_STYLE,
+        '34%', ROBOT_STAT_INFO_STYLE,
+        '128MB', ROBOT_STAT_INFO_STYLE,
+        '42%', ROBOT_STAT_OK_STYLE,
+        '18ms', ROBOT_STAT_OK_STYLE
+    ]);
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        robot: {
+            // Update robot status displays - clear when disconnected
+            status_displays: function(state) {
+                const cs = (state || {}).connection_status;
+                if (!cs || cs === 'disconnected') {
+                    return ROBOT_STATUS_DISCONNECTED.slice();
+                }
+                return ROBOT_STATUS_CONNECTED.slice();
+            }
+        }
+    });
+})();
@@ -1,9 +1,11 @@
 package frc.robot.subsystems;
 
 import edu.wpi.first.networktables.BooleanPublisher;
+import edu.wpi.first.networktables.DoubleArrayPublisher;
 import edu.wpi.first.networktables.DoublePublisher;
 import edu.wpi.first.networktables.NetworkTable;
 import edu.wpi.first.networktables.NetworkTableInstance;
+import edu.wpi.first.networktables.PubSubOption;
 import edu.wpi.first.util.sendable.SendableBuilder;
 import edu.wpi.first.wpilibj.Timer;
 import edu.wpi.first.wpilibj2.command.SubsystemBase;
@@ -64,6 +66,15 @@ public class FiringSolver extends SubsystemBase {
   private final DoublePublisher m_projectileMassPub;
   private final DoublePublisher m_projectileAreaPub;
 
+  // Whole shot in one value, published before ShotTimestamp. Layout must match
+  // SHOT_PACKET_VERSION and SHOT_PACKET_FIELDS in MLtune/tuner/nt_interface.py.
+  private static final double kShotPacketVersion = 1;
+  private final DoubleArrayPublisher m_shotPacketPub;
+
+  // Last heights passed to logShot, carried in every shot packet
+  private double m_targetHeightMeters = 0.0;
+  private double m_launchHeightMeters = 0.0;
+
   // === Physics constants ===
   private static final double GRAVITY = 9.80665;
 
@@ -87,6 +98,10 @@ public class FiringSolver extends SubsystemBase {
     m_pitchPub = solutionTable.getDoubleTopic("pitchRadians").publish();
     m_velocityPub = solutionTable.getDoubleTopic("exitVelocity").publish();
     m_yawPub = solutionTable.getDoubleTopic("yawRadians").publish();
+
+    // sendAll so NT4 delivers every packet instead of coalescing rapid shots
+    m_shotPacketPub =
+        shotTable.getDoubleArrayTopic("ShotPacket").publish(PubSubOption.sendAll(true));
   }
 
   // === Shot logging ===
@@ -102,7 +117,8 @@ public class FiringSolver extends SubsystemBase {
       double exitVelocityMps,
       double yawRadians) {
 
-    m_shotTimestampPub.set(Timer.getFPGATimestamp());
+    double timestamp = Timer.getFPGATimestamp();
+
     m_hitPub.set(hit);
     m_distancePub.set(distanceMeters);
 
@@ -115,6 +131,26 @@ public class FiringSolver extends SubsystemBase {
     m_projectileMassPub.set(m_projectileMass.get());
     m_projectileAreaPub.set(m_projectileArea.get());
 
+    m_shotPacketPub.set(
+        new double[] {
+          kShotPacketVersion,
+          timestamp,
+          hit ? 1.0 : 0.0,
+          distanceMeters,
+          pitchRadians,
+          exitVelocityMps,
+          yawRadians,
+          m_targetHeightMeters,
+          m_launchHeightMeters,
+          m_dragCoefficient.get(),
+          m_airDensity.get(),
+          m_projectileMass.get(),
+          m_projectileArea.get()
+        });
+
+    // Timestamp last: the tuner treats a new value as "shot complete"
+    m_shotTimestampPub.set(timestamp);
+
     // AdvantageKit/NT logging
     Logger.recordOutput("FiringSolver/Hit", hit);
     Logger.recordOutput("FiringSolver/Solution",
@@ -130,9 +166,11 @@ public class FiringSolver extends SubsystemBase {
       double yawRadians,
       double targetHeightMeters,
       double launchHeightMeters) {
-    logShot(hit, distanceMeters, pitchRadians, exitVelocityMps, yawRadians);
+    m_targetHeightMeters = targetHeightMeters;
+    m_launchHeightMeters = launchHeightMeters;
     m_targetHeightPub.set(targetHeightMeters);
     m_launchHeightPub.set(launchHeightMeters);
+    logShot(hit, distanceMeters, pitchRadians, exitVelocityMps, yawRadians);
 
     Logger.recordOutput("FiringSolver/TargetHeight", targetHeightMeters);
     Logger.recordOutput("FiringSolver/LaunchHeight", launchHeightMeters);
@@ -32,6 +32,10 @@ public final class TunerInterface {
   private final DoubleSubscriber m_shotCountSub;
   private final DoubleSubscriber m_shotThresholdSub;
 
+  // Last heartbeat value seen and the FPGA time it changed, for isTunerConnected()
+  private double m_lastHeartbeat = 0.0;
+  private double m_lastHeartbeatChangeTime = 0.0;
+
   // Interlock subscribers
   private final BooleanSubscriber m_requireShotLoggedSub;
   private final BooleanSubscriber m_requireCoeffUpdatedSub;
@@ -85,15 +89,20 @@ public final class TunerInterface {
   /**
    * Checks if the Python tuner is connected and running.
    *
-   * <p>The tuner updates a timestamp periodically. If it hasn't been updated recently, the tuner is
-   * probably not running.
+   * <p>The tuner publishes a heartbeat value that changes periodically. The value comes from the
+   * tuner computer's own clock, so only whether it changed is meaningful here. If it hasn't changed
+   * recently, the tuner is probably not running.
    *
    * @return true if tuner appears to be connected
    */
   public boolean isTunerConnected() {
     double heartbeat = m_heartbeatSub.get();
     double now = Timer.getFPGATimestamp();
-    return (now - heartbeat) < 5.0;
+    if (heartbeat != m_lastHeartbeat) {
+      m_lastHeartbeat = heartbeat;
+      m_lastHeartbeatChangeTime = now;
+    }
+    return heartbeat != 0.0 && (now - m_lastHeartbeatChangeTime) < 5.0;
   }
 
   /**
@@ -14,69 +14,208 @@ To set up auto-start:
 import sys
 import os
 import time
-import configparser
+import selectors
+import signal
+import socket
+import threading
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # Optional: without watchdog the config file's stat is polled instead
+    Observer = None
 
 # Add parent directory (MLtune) to path to import tuner module
 script_dir = os.path.dirname(os.path.abspath(__file__))
 MLtune_dir = os.path.dirname(script_dir)
-sys.path.insert(0, MLtune_dir)
+if MLtune_dir not in sys.path:
+    sys.path.insert(0, MLtune_dir)
 
-from MLtune.tuner import BayesianTunerCoordinator, TunerConfig, setup_logging
+# Same single-pass INI reader as TUNER_TOGGLES.ini, much lighter than configparser
+from MLtune.tuner.config import get_bool, get_int, parse_ini
 import logging
 
+# Files next to this script, resolved once at import
+CONFIG_FILE = os.path.join(script_dir, 'tuner_config.ini')
+LOG_FILE = os.path.join(script_dir, 'tuner_logs', 'tuner_daemon.log')
+
+# How often to check tuner_config.ini for changes when watchdog is not installed
+# (the same once-a-minute check the daemon has always done)
+CONFIG_POLL_SECONDS = 60.0
+
+# A change is only reported once the file has stopped changing for this long,
+# so a save that truncates and then writes is never loaded half-empty
+CONFIG_SETTLE_SECONDS = 0.5
+
+
+def _config_signature(path):
+    """
+    Return (mtime_ns, size, inode) for the file, or None if it doesn't exist.
+    
+    mtime alone is not enough on filesystems with coarse timestamps: a read of a
+    half-written file can share its mtime with the finished write. The inode
+    changes when an editor saves by renaming a new file into place.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _SettledChange:
+    """
+    Coalesces change notifications for a file into one per finished write.
+    
+    Every changed() call restarts a CONFIG_SETTLE_SECONDS timer. When it fires
+    the file is stat'ed again: if it is still changing the timer restarts,
+    otherwise on_change is called, once per distinct file signature.
+    """
+    
+    def __init__(self, config_file, on_change):
+        self._config_file = config_file
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._timer = None
+        self._reported = _config_signature(config_file)
+    
+    def changed(self):
+        """Note that the file may have changed and (re)start the settle window."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(
+                CONFIG_SETTLE_SECONDS, self._settle, args=(_config_signature(self._config_file),)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _settle(self, signature):
+        current = _config_signature(self._config_file)
+        if current != signature:
+            # Still being written; wait for another quiet window
+            self.changed()
+            return
+        with self._lock:
+            if current == self._reported:
+                return
+            self._reported = current
+        self._on_change()
+
+
+def watch_config_file(config_file, on_change):
+    """
+    Call on_change() whenever config_file is created, modified or replaced.
+    
+    Uses filesystem notifications when watchdog is installed, otherwise a
+    background thread that compares the file's stat signature every
+    CONFIG_POLL_SECONDS. Either way bursts of writes are coalesced and the
+    callback only runs once the file has settled. on_change is called from a
+    background thread.
+    """
+    config_file = os.path.realpath(config_file)
+    settled = _SettledChange(config_file, on_change)
+    
+    if Observer is not None:
+        # Only writes, creation and rename-into-place count; opened/closed events
+        # (including the daemon's own reads) must not trigger a reload
+        class ConfigChangeHandler(FileSystemEventHandler):
+            def on_modified(self, event):
+                if event.src_path == config_file:
+                    settled.changed()
+            
+            def on_created(self, event):
+                if event.src_path == config_file:
+                    settled.changed()
+            
+            def on_moved(self, event):
+                # Editors often save by writing a temp file and renaming it over the original
+                if event.dest_path == config_file:
+                    settled.changed()
+        
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(ConfigChangeHandler(), os.path.dirname(config_file), recursive=False)
+        observer.start()
+        return
+    
+    def poll():
+        last_signature = _config_signature(config_file)
+        while True:
+            time.sleep(CONFIG_POLL_SECONDS)
+            signature = _config_signature(config_file)
+            if signature != last_signature:
+                last_signature = signature
+                settled.changed()
+    
+    threading.Thread(target=poll, name="ConfigWatcher", daemon=True).start()
+
+
+# Settings used when tuner_config.ini is missing or unreadable
+_DEFAULT_SETTINGS = {
+    'enabled': False,
+    'team_number': 0,
+    'require_shot_logged': False,
+    'require_coefficients_updated': False
+}
+
+# (signature, settings) of the last load, so an unchanged file isn't re-parsed
+_config_cache = (None, None)
+
 
 def load_config_from_file():
     """Load configuration from tuner_config.ini file."""
-    config_file = os.path.join(os.path.dirname(__file__), 'tuner_config.ini')
+    global _config_cache
+    
+    signature = _config_signature(CONFIG_FILE)
+    
+    cached_signature, cached_settings = _config_cache
+    if cached_settings is not None and signature == cached_signature:
+        return cached_settings
     
     # Defaults if no config file
-    if not os.path.exists(config_file):
-        return {
-            'enabled': False, 
-            'team_number': 0,
-            'require_shot_logged': False,
-            'require_coefficients_updated': False
-        }
+    if signature is None:
+        _config_cache = (None, _DEFAULT_SETTINGS)
+        return _DEFAULT_SETTINGS
     
     try:
-        parser = configparser.ConfigParser()
-        parser.read(config_file)
+        with open(CONFIG_FILE, encoding='utf-8') as f:
+            data = parse_ini(f.read())
         
-        enabled = parser.getboolean('tuner', 'enabled', fallback=False)
-        team_number = parser.getint('tuner', 'team_number', fallback=0)
+        enabled = get_bool(data, 'tuner', 'enabled', fallback=False)
+        team_number = get_int(data, 'tuner', 'team_number', fallback=0)
         
         # Read shooting interlock settings
-        require_shot_logged = parser.getboolean('shooting_interlocks', 'require_shot_logged', fallback=False)
-        require_coefficients_updated = parser.getboolean('shooting_interlocks', 'require_coefficients_updated', fallback=False)
+        require_shot_logged = get_bool(data, 'shooting_interlocks', 'require_shot_logged', fallback=False)
+        require_coefficients_updated = get_bool(data, 'shooting_interlocks', 'require_coefficients_updated', fallback=False)
         
-        return {
+        settings = {
             'enabled': enabled,
             'team_number': team_number,
             'require_shot_logged': require_shot_logged,
             'require_coefficients_updated': require_coefficients_updated,
         }
     except Exception as e:
+        # Not cached, so a half-written file is retried on the next load
         logging.error(f"Error loading config: {e}")
-        return {
-            'enabled': False, 
-            'team_number': 0,
-            'require_shot_logged': False,
-            'require_coefficients_updated': False
-        }
+        return _DEFAULT_SETTINGS
+    
+    _config_cache = (signature, settings)
+    return settings
 
 
 def main():
     """Main daemon loop."""
     
     # Silent logging to file only
-    log_file = os.path.join(os.path.dirname(__file__), 'tuner_logs', 'tuner_daemon.log')
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
     
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            logging.FileHandler(LOG_FILE),
         ]
     )
     
@@ -85,6 +224,58 @@ def main():
     logger.info("Tuner Daemon Started")
     logger.info("=" * 60)
     
+    # The main loop sleeps in a selector until one of two sockets is readable:
+    # the watcher thread writes to config_send, and the signal module writes the
+    # signal number to signal_send (set_wakeup_fd), so an idle daemon never wakes
+    # on its own and no locks are taken from a signal handler.
+    config_recv, config_send = socket.socketpair()
+    signal_recv, signal_send = socket.socketpair()
+    for sock in (config_recv, config_send, signal_recv, signal_send):
+        sock.setblocking(False)
+    
+    selector = selectors.DefaultSelector()
+    selector.register(config_recv, selectors.EVENT_READ)
+    selector.register(signal_recv, selectors.EVENT_READ)
+    
+    def notify_config_changed():
+        try:
+            config_send.send(b'\0')
+        except OSError:
+            # Buffer full: a wakeup is already pending
+            pass
+    
+    watch_config_file(CONFIG_FILE, notify_config_changed)
+    
+    # The Python-level handler only has to replace the default action (exiting
+    # without cleanup); the signal number arrives through signal_recv
+    signal.set_wakeup_fd(signal_send.fileno())
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: None)
+    signal.signal(signal.SIGINT, lambda _signum, _frame: None)
+    
+    def drain(sock):
+        """Read and return everything pending on a non-blocking socket."""
+        data = b''
+        while True:
+            try:
+                chunk = sock.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                return data
+            if not chunk:
+                return data
+            data += chunk
+    
+    def wait_for_config_change():
+        """Block until the config file changes. Returns None once shutdown is requested."""
+        while True:
+            ready = {key.fileobj for key, _events in selector.select()}
+            if signal_recv in ready:
+                signals = drain(signal_recv)
+                if signals:
+                    logger.info(f"Received signal {signals[0]} - shutting down")
+                    return None
+            if config_recv in ready and drain(config_recv):
+                return load_config_from_file()
+    
     # Load configuration
     settings = load_config_from_file()
     
@@ -94,8 +285,10 @@ def main():
         # Daemon stays running but doesn't do anything
         # This way it's always ready if programmers enable it
         while True:
-            time.sleep(60)  # Check every minute if config changed
-            new_settings = load_config_from_file()
+            new_settings = wait_for_config_change()
+            if new_settings is None:
+                logger.info("Daemon stopped by signal")
+                return
             if new_settings['enabled']:
                 settings = new_settings
                 break
@@ -115,6 +308,10 @@ def main():
     
     logger.info(f"Target robot IP: {server_ip or 'auto-detect'}")
     
+    # Deferred until the tuner is enabled: pulls in NetworkTables and
+    # scikit-optimize, which an idle daemon never needs
+    from MLtune.tuner import BayesianTunerCoordinator, TunerConfig
+    
     # Create tuner config with interlock settings
     config = TunerConfig()
     config.TUNER_ENABLED = True
@@ -132,30 +329,23 @@ def main():
         logger.info("Tuner running in background")
         logger.info("Drivers don't need to do anything!")
         
-        # Keep running until interrupted
+        # Keep running until a signal arrives, following enable/disable in the config
         while True:
-            time.sleep(10)
-            
-            # Check if we should reload config
-            new_settings = load_config_from_file()
-            if not new_settings['enabled'] and settings['enabled']:
+            new_settings = wait_for_config_change()
+            if new_settings is None:
+                break
+            if new_settings['enabled'] == settings['enabled']:
+                continue
+            if new_settings['enabled']:
+                logger.info("Tuner re-enabled - restarting")
+                coordinator.start(server_ip=server_ip)
+            else:
                 logger.info("Tuner disabled in config - stopping")
                 coordinator.stop()
-                settings = new_settings
-                # Wait for re-enable
-                while True:
-                    time.sleep(60)
-                    newer_settings = load_config_from_file()
-                    if newer_settings['enabled']:
-                        logger.info("Tuner re-enabled - restarting")
-                        coordinator.start(server_ip=server_ip)
-                        settings = newer_settings
-                        break
-            
-    except KeyboardInterrupt:
+            settings = new_settings
+        
         logger.info("Daemon stopped by signal")
-        if 'coordinator' in locals():
-            coordinator.stop()
+        coordinator.stop()
     except Exception as e:
         logger.error(f"Daemon error: {e}", exc_info=True)
         if 'coordinator' in locals():